@@ -240,14 +240,113 @@ check_and_install_dependencies()
 
 import argparse
 import requests
-from typing import List, Dict, Optional, Tuple
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from collections import defaultdict, deque, OrderedDict
+from typing import List, Dict, Iterable, Iterator, Optional, Sequence, Tuple
+from types import MappingProxyType
 from urllib.parse import quote, urljoin
 import time
 import re
+import bisect
+import operator
+import mmap
+import itertools
 from datetime import datetime
 import json
 import tempfile
+import threading
 import shutil
+import html as html_lib
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
+
+_CTID_COMBINED_RE = re.compile(
+    r'(?:ctid["\']?\s*[:=]\s*["\']?|ctid[/=]|["\']id["\']\s*:\s*["\']?|id["\']?\s*:\s*["\']?|value["\']?\s*:\s*["\']?)'
+    r'(?P<id>\d{3,5})(?!\d)'
+)
+_HEADING_RES = {
+    tag: re.compile(rf'<{tag}\b[^>]*>(.*?)</{tag}>', re.I | re.S)
+    for tag in ('h1', 'h2', 'title')
+}
+_TAG_RE = re.compile(r'<[^>]+>')
+_JSON_WS_RE = re.compile(r'[ \t\n\r]*')
+_FREQ_RE = re.compile(r'(\d+\.\d+)')
+_TONE_COMBO_RE = re.compile(r'(?P<dcs>DT?CS)|(?P<num>\d+\.?\d*)', re.I)
+_OFFSET_RE = re.compile(r'([+-]?\d+\.?\d*)\s*(?:MHz|Mhz|mhz)?')
+_MODE_RE = re.compile(r'(?P<Digital>P25|DIGITAL)|(?P<DMR>DMR)|(?P<NXDN>NXDN)|(?P<FM>FM)')
+_MODE_FM = sys.intern('FM')
+_MODE_PRIORITY = (sys.intern('Digital'), sys.intern('DMR'), sys.intern('NXDN'), _MODE_FM)
+_NO_TONE = sys.intern('No Tone')
+_NO_TONE_TRIPLE = (_NO_TONE, '', '')
+_POL_NN = sys.intern('NN')
+_TSTEP_25 = sys.intern('25.0')
+_REPEATER_TYPE_RE = re.compile(r'RM|REPEATER')
+_BAND_LOWS = [144.0, 150.0, 440.0]
+_BAND_DATA = [(148.0, '+', '0.6'), (160.0, '+', '0.0'), (450.0, '+', '5.0')]
+
+
+def _band_for(freq_val: float) -> Tuple[str, str]:
+    """Return the default repeater (duplex, offset) for a frequency in MHz"""
+    i = bisect.bisect_right(_BAND_LOWS, freq_val) - 1
+    if i < 0:
+        return ('', '')
+    high, duplex, offset = _BAND_DATA[i]
+    return (duplex, offset) if freq_val <= high else ('', '')
+
+
+try:
+    from bs4 import BeautifulSoup
+    HAS_BS4 = True
+except ImportError:
+    HAS_BS4 = False
+
+BS4_PARSER = 'lxml' if importlib.util.find_spec('lxml') else 'html.parser'
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Importing readline gives every input() prompt line editing and history
+# (pyreadline3 provides the same module on Windows when installed)
+try:
+    import readline  # noqa: F401 - imported only for its effect on input()
+    HAS_READLINE = True
+    # GNU readline hides \001/\002-wrapped prompt codes; libedit (macOS) prints them
+    _READLINE_PROMPT_MARKERS = os.name == 'posix' and 'libedit' not in (readline.__doc__ or '')
+except ImportError:
+    HAS_READLINE = False
+    _READLINE_PROMPT_MARKERS = False
+
+_ANSI_ESCAPE_RE = re.compile(r'(\x1b\[[0-9;]*m)')
+
+
+def _json_loads(data):
+    """Parse JSON text or bytes, using orjson when it is installed"""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps_indented(obj) -> bytes:
+    """Serialize to 2-space indented UTF-8 JSON bytes, using orjson when it is installed"""
+    if HAS_ORJSON:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            pass
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _json_load_mapped(path: str):
+    """Parse a JSON file through a read-only memory map of its contents"""
+    with open(path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if HAS_ORJSON:
+                with memoryview(mapped) as view:
+                    return orjson.loads(view)
+            return json.loads(mapped[:])
 
 try:
     from colorama import init, Fore, Style, Back
@@ -274,6 +373,45 @@ class Colors:
     RESET = Style.RESET_ALL
 
 
+# Precompiled row templates; the ANSI codes are baked in once at import
+_MENU_OPTION_TMPL = f"{Colors.INFO}[%s]{Colors.RESET} %s {Colors.DIM}(or: %s){Colors.RESET}"
+_MODEL_HEADING_TMPL = f"{Colors.INFO}[%d]{Colors.RESET} {Colors.HEADER}%s{Colors.RESET}\n"
+_BACKUP_ERROR_TMPL = f"  {Colors.INFO}[%d]{Colors.RESET} %s {Colors.DIM}(Error reading metadata){Colors.RESET}\n"
+_BACKUP_ROW_TMPL = (
+    f"  {Colors.INFO}[%d]{Colors.RESET} {Colors.HEADER}%s{Colors.RESET} %s\n"
+    "      Radio: %s\n"
+    "      Port: %s\n"
+    "      Date: %s"
+)
+_BACKUP_RESTORE_TAG = f"{Colors.SUCCESS}[RESTORE]{Colors.RESET}"
+_BACKUP_NO_DATA_TAG = f"{Colors.DIM}[NO DATA]{Colors.RESET}"
+
+_MENU_OPTIONS = [
+    ('1', 'Search by ZIP Code', 'zip, zipcode'),
+    ('2', 'Search by City & State', 'city'),
+    ('3', 'Search by County & State', 'county'),
+    ('4', 'Import CSV to Handheld', 'import, upload'),
+    ('5', 'Create Backup', 'backup, save'),
+    ('6', 'Restore from Backup', 'restore'),
+    ('7', 'Validate CSV File', 'validate'),
+    ('8', 'View Serial Ports', 'ports, serial'),
+    ('9', 'Select Radio Model', 'models, radios, select'),
+    ('10', 'Filter Existing CSV', 'filter'),
+    ('11', 'Convert CSV to TXT', 'convert, csv2txt'),
+    ('12', 'View Backup Files', 'backups, viewbackups'),
+    ('13', 'Build County Cache', 'cache, buildcache'),
+    ('14', 'Add GMRS/FRS Channels', 'gmrs, frs'),
+    ('15', 'Add NOAA Weather Channels', 'weather, wx, noaa'),
+    None,
+    ('C', 'Clear Lookup Cache', 'clear, clearcache'),
+    ('0/Q', 'Exit', 'quit, exit'),
+]
+
+_MENU_OPTIONS_TEXT = "\n".join(
+    _MENU_OPTION_TMPL % option if option else "" for option in _MENU_OPTIONS
+)
+
+
 def print_banner():
     COLOR_RADIO = Fore.RED + Style.BRIGHT
     COLOR_FREQ = Fore.YELLOW + Style.BRIGHT
@@ -427,58 +565,89 @@ def get_connection_status() -> Tuple[bool, Optional[str], Optional[str]]:
 
 
 def print_menu():
-    print(f"\n{Colors.HEADER}{'='*60}{Colors.RESET}")
-    print(f"{Colors.HEADER}  MAIN MENU{Colors.RESET}")
-    print(f"{Colors.HEADER}{'='*60}{Colors.RESET}\n")
+    lines = []
+    lines.append(f"\n{Colors.HEADER}{'='*60}{Colors.RESET}")
+    lines.append(f"{Colors.HEADER}  MAIN MENU{Colors.RESET}")
+    lines.append(f"{Colors.HEADER}{'='*60}{Colors.RESET}\n")
     
     selected_radio = get_selected_radio_model()
     if selected_radio:
-        print(f"{Colors.INFO}Selected Radio:{Colors.RESET} {Colors.SUCCESS}{selected_radio['name']}{Colors.RESET} ({selected_radio['manufacturer']})")
-        print(f"{Colors.DIM}  Baudrate: {selected_radio['baudrate']} | Max Channels: {selected_radio['max_channels']} | CHIRP ID: {selected_radio['chirp_id']}{Colors.RESET}\n")
+        lines.append(f"{Colors.INFO}Selected Radio:{Colors.RESET} {Colors.SUCCESS}{selected_radio['name']}{Colors.RESET} ({selected_radio['manufacturer']})")
+        lines.append(f"{Colors.DIM}  Baudrate: {selected_radio['baudrate']} | Max Channels: {selected_radio['max_channels']} | CHIRP ID: {selected_radio['chirp_id']}{Colors.RESET}\n")
     else:
-        print(f"{Colors.WARNING}⚠  No radio model selected{Colors.RESET} {Colors.DIM}(Use option 9 to select){Colors.RESET}\n")
+        lines.append(f"{Colors.WARNING}⚠  No radio model selected{Colors.RESET} {Colors.DIM}(Use option 9 to select){Colors.RESET}\n")
     
     is_connected, port, radio_name = get_connection_status()
     if is_connected and port:
-        print(f"{Colors.SUCCESS}✓ Radio Connected:{Colors.RESET} {port}")
+        lines.append(f"{Colors.SUCCESS}✓ Radio Connected:{Colors.RESET} {port}")
         if radio_name:
-            print(f"{Colors.DIM}  Detected: {radio_name}{Colors.RESET}\n")
+            lines.append(f"{Colors.DIM}  Detected: {radio_name}{Colors.RESET}\n")
         else:
-            print()
+            lines.append("")
     else:
-        print(f"{Colors.WARNING}⚠ Radio Not Connected{Colors.RESET} {Colors.DIM}(Connect USB cable and select port){Colors.RESET}\n")
-    
-    print(f"{Colors.HEADER}{'─'*60}{Colors.RESET}\n")
-    
-    print(f"{Colors.INFO}[1]{Colors.RESET} Search by ZIP Code {Colors.DIM}(or: zip, zipcode){Colors.RESET}")
-    print(f"{Colors.INFO}[2]{Colors.RESET} Search by City & State {Colors.DIM}(or: city){Colors.RESET}")
-    print(f"{Colors.INFO}[3]{Colors.RESET} Search by County & State {Colors.DIM}(or: county){Colors.RESET}")
-    print(f"{Colors.INFO}[4]{Colors.RESET} Import CSV to Handheld {Colors.DIM}(or: import, upload){Colors.RESET}")
-    print(f"{Colors.INFO}[5]{Colors.RESET} Create Backup {Colors.DIM}(or: backup, save){Colors.RESET}")
-    print(f"{Colors.INFO}[6]{Colors.RESET} Restore from Backup {Colors.DIM}(or: restore){Colors.RESET}")
-    print(f"{Colors.INFO}[7]{Colors.RESET} Validate CSV File {Colors.DIM}(or: validate){Colors.RESET}")
-    print(f"{Colors.INFO}[8]{Colors.RESET} View Serial Ports {Colors.DIM}(or: ports, serial){Colors.RESET}")
-    print(f"{Colors.INFO}[9]{Colors.RESET} Select Radio Model {Colors.DIM}(or: models, radios, select){Colors.RESET}")
-    print(f"{Colors.INFO}[10]{Colors.RESET} Filter Existing CSV {Colors.DIM}(or: filter){Colors.RESET}")
-    print(f"{Colors.INFO}[11]{Colors.RESET} Convert CSV to TXT {Colors.DIM}(or: convert, csv2txt){Colors.RESET}")
-    print(f"{Colors.INFO}[12]{Colors.RESET} View Backup Files {Colors.DIM}(or: backups, viewbackups){Colors.RESET}")
-    print(f"{Colors.INFO}[13]{Colors.RESET} Build County Cache {Colors.DIM}(or: cache, buildcache){Colors.RESET}")
-    print(f"{Colors.INFO}[14]{Colors.RESET} Add GMRS/FRS Channels {Colors.DIM}(or: gmrs, frs){Colors.RESET}")
-    print(f"{Colors.INFO}[15]{Colors.RESET} Add NOAA Weather Channels {Colors.DIM}(or: weather, wx, noaa){Colors.RESET}")
-    print()
-    print(f"{Colors.INFO}[0/Q]{Colors.RESET} Exit {Colors.DIM}(or: quit, exit){Colors.RESET}")
-    print(f"\n{Colors.HEADER}{'='*60}{Colors.RESET}\n")
+        lines.append(f"{Colors.WARNING}⚠ Radio Not Connected{Colors.RESET} {Colors.DIM}(Connect USB cable and select port){Colors.RESET}\n")
+    
+    lines.append(f"{Colors.HEADER}{'─'*60}{Colors.RESET}\n")
+    
+    lines.append(_MENU_OPTIONS_TEXT)
+    lines.append(f"\n{Colors.HEADER}{'='*60}{Colors.RESET}\n")
+    
+    print("\n".join(lines))
+
+
+_prompt_cache = {}
+
+
+def _render_prompt(prompt: str, color: str) -> str:
+    """
+    Build the coloured input() prompt once per (prompt, color) pair
+    
+    With GNU readline the ANSI codes are wrapped in \\001/\\002 so they are
+    not counted towards the prompt width when editing the line.
+    """
+    key = (prompt, color)
+    rendered = _prompt_cache.get(key)
+    if rendered is None:
+        rendered = f"{color}{prompt}{Colors.RESET}"
+        if _READLINE_PROMPT_MARKERS:
+            rendered = _ANSI_ESCAPE_RE.sub('\x01\\1\x02', rendered)
+        _prompt_cache[key] = rendered
+    return rendered
 
 
 def get_user_input(prompt: str, color: str = Colors.INFO) -> str:
     try:
-        return input(f"{color}{prompt}{Colors.RESET}").strip()
+        return input(_render_prompt(prompt, color)).strip()
     except KeyboardInterrupt:
         print(f"\n\n{Colors.WARNING}Operation cancelled by user.{Colors.RESET}")
         sys.exit(0)
 
 
-def detect_serial_ports() -> List[Tuple[str, str]]:
+SERIAL_PORTS_CACHE_TTL = 2.0
+_serial_ports_cache = None
+
+
+def detect_serial_ports(force: bool = False) -> List[Tuple[str, str]]:
+    """
+    List USB serial ports, reusing a scan made in the last SERIAL_PORTS_CACHE_TTL seconds
+    
+    Args:
+        force: If True, always rescan the system's serial ports
+        
+    Returns:
+        List of (device, description) tuples
+    """
+    global _serial_ports_cache
+    now = time.monotonic()
+    if not force and _serial_ports_cache and now - _serial_ports_cache[0] < SERIAL_PORTS_CACHE_TTL:
+        return list(_serial_ports_cache[1])
+    
+    ports = _scan_serial_ports()
+    _serial_ports_cache = (now, ports)
+    return list(ports)
+
+
+def _scan_serial_ports() -> List[Tuple[str, str]]:
     try:
         import serial.tools.list_ports
         
@@ -564,7 +733,131 @@ def detect_serial_ports() -> List[Tuple[str, str]]:
         return []
 
 
-def validate_chirp_csv(csv_file: str) -> Tuple[bool, str, List[Dict]]:
+# FTDI USB-serial chips (VID 0403) default to a 16 ms latency timer
+_FTDI_VID_PID_RE = re.compile(r'VID:PID=0403:[0-9A-F]{4}', re.I)
+_USB_SERIAL_SYSFS = "/sys/bus/usb-serial/devices"
+
+
+def get_ftdi_latency_timer_path(port_name: str, description: str = "") -> Optional[str]:
+    """
+    Find the sysfs latency_timer file of an FTDI USB-serial port (Linux only)
+    
+    Args:
+        port_name: Device path, e.g. /dev/ttyUSB0
+        description: Port description as returned by detect_serial_ports
+        
+    Returns:
+        Path to the latency_timer file, or None if the port is not an FTDI adapter
+    """
+    if not sys.platform.startswith('linux'):
+        return None
+    
+    device_dir = os.path.join(_USB_SERIAL_SYSFS, os.path.basename(port_name))
+    timer_path = os.path.join(device_dir, "latency_timer")
+    if not os.path.exists(timer_path):
+        return None
+    
+    driver = os.path.basename(os.path.realpath(os.path.join(device_dir, "driver")))
+    if driver == 'ftdi_sio' or _FTDI_VID_PID_RE.search(description):
+        return timer_path
+    return None
+
+
+def set_serial_low_latency(port_name: str, timer_path: str) -> Tuple[bool, str]:
+    """
+    Set an FTDI port's latency timer to 1 ms so CHIRP reads are not delayed
+    
+    Args:
+        port_name: Device path, e.g. /dev/ttyUSB0
+        timer_path: Path returned by get_ftdi_latency_timer_path
+        
+    Returns:
+        Tuple of (success, message)
+    """
+    try:
+        with open(timer_path, 'r') as f:
+            if f.read().strip() == '1':
+                return True, f"{port_name} is already set to low latency (1 ms)"
+        with open(timer_path, 'w') as f:
+            f.write('1')
+        return True, f"{port_name} latency timer set to 1 ms"
+    except PermissionError:
+        return False, (f"Permission denied for {port_name}. Run: "
+                       f"sudo setserial {port_name} low_latency")
+    except OSError as e:
+        return False, f"Could not set latency timer for {port_name}: {e}"
+
+
+def _check_chirp_csv_header(fieldnames: Optional[List[str]]) -> Optional[str]:
+    """
+    Check a CHIRP CSV header row for the required columns
+    
+    Args:
+        fieldnames: Column names read from the header row
+        
+    Returns:
+        Error message, or None if the header is usable
+    """
+    required_columns = ['Location', 'Frequency', 'Name']
+    if not fieldnames:
+        return "CSV file appears to be empty or invalid"
+    
+    missing_columns = [col for col in required_columns if col not in fieldnames]
+    if missing_columns:
+        return f"Missing required columns: {', '.join(missing_columns)}"
+    return None
+
+
+def _iter_chirp_csv_rows(csv_file: str) -> Iterator[Dict]:
+    """
+    Parse and validate CHIRP CSV rows on demand
+    
+    Args:
+        csv_file: Path to a CSV file whose header was already checked
+        
+    Yields:
+        Row dictionaries in file order
+        
+    Raises:
+        ValueError: After the last row, if any row failed validation
+    """
+    with open(csv_file, 'r', encoding='utf-8') as f:
+        errors = []
+        for idx, row in enumerate(csv.DictReader(f), start=2):
+            try:
+                freq = row.get('Frequency', '').strip()
+                if freq:
+                    try:
+                        freq_float = float(freq)
+                        if freq_float < 30 or freq_float > 1000:
+                            errors.append(f"Row {idx}: Frequency {freq} out of typical range")
+                    except ValueError:
+                        errors.append(f"Row {idx}: Invalid frequency format: {freq}")
+            except Exception as e:
+                errors.append(f"Row {idx}: {str(e)}")
+                continue
+            yield row
+    
+    if errors:
+        error_msg = f"Found {len(errors)} validation errors:\n" + "\n".join(errors[:5])
+        if len(errors) > 5:
+            error_msg += f"\n... and {len(errors) - 5} more errors"
+        raise ValueError(error_msg)
+
+
+def validate_chirp_csv(csv_file: str, lazy: bool = False) -> Tuple[bool, str, Iterable[Dict]]:
+    """
+    Validate a CHIRP CSV file and load its rows
+    
+    Args:
+        csv_file: Path to the CSV file
+        lazy: Only check the header now and return a generator that parses
+              and validates the rows when consumed (raising ValueError at
+              the end if any row is invalid)
+        
+    Returns:
+        Tuple of (is_valid, message, frequencies)
+    """
     if not os.path.exists(csv_file):
         return False, f"File not found: {csv_file}", []
     
@@ -572,38 +865,24 @@ def validate_chirp_csv(csv_file: str) -> Tuple[bool, str, List[Dict]]:
         with open(csv_file, 'r', encoding='utf-8') as f:
             reader = csv.DictReader(f)
             
-            required_columns = ['Location', 'Frequency', 'Name']
-            if not reader.fieldnames:
-                return False, "CSV file appears to be empty or invalid", []
-            
-            missing_columns = [col for col in required_columns if col not in reader.fieldnames]
-            if missing_columns:
-                return False, f"Missing required columns: {', '.join(missing_columns)}", []
-            
-            frequencies = []
-            errors = []
-            for idx, row in enumerate(reader, start=2):
-                try:
-                    freq = row.get('Frequency', '').strip()
-                    if freq:
-                        try:
-                            freq_float = float(freq)
-                            if freq_float < 30 or freq_float > 1000:
-                                errors.append(f"Row {idx}: Frequency {freq} out of typical range")
-                        except ValueError:
-                            errors.append(f"Row {idx}: Invalid frequency format: {freq}")
-                    
-                    frequencies.append(row)
-                except Exception as e:
-                    errors.append(f"Row {idx}: {str(e)}")
-            
-            if errors:
-                error_msg = f"Found {len(errors)} validation errors:\n" + "\n".join(errors[:5])
-                if len(errors) > 5:
-                    error_msg += f"\n... and {len(errors) - 5} more errors"
-                return False, error_msg, frequencies
+            header_error = _check_chirp_csv_header(reader.fieldnames)
+            if header_error:
+                return False, header_error, []
             
-            return True, f"Valid CHIRP CSV with {len(frequencies)} frequencies", frequencies
+            if lazy:
+                return True, "CHIRP CSV header is valid", _iter_chirp_csv_rows(csv_file)
+        
+        frequencies = []
+        try:
+            for row in _iter_chirp_csv_rows(csv_file):
+                frequencies.append(row)
+        except UnicodeDecodeError:
+            raise
+        except ValueError as e:
+            # Raised after the last row with the summary of row validation errors
+            return False, str(e), frequencies
+        
+        return True, f"Valid CHIRP CSV with {len(frequencies)} frequencies", frequencies
             
     except Exception as e:
         return False, f"Error reading CSV file: {str(e)}", []
@@ -1146,6 +1425,34 @@ def get_radio_models() -> List[Dict[str, any]]:
 
 
 
+_radio_model_lines = None
+
+
+def _get_radio_model_lines() -> List[Tuple[str, str, str]]:
+    """
+    Get the pre-rendered radio model catalog, built on first use
+    
+    Returns:
+        List of (model name, heading line, detail lines) tuples; the caller
+        prefixes the heading with the selected-model marker
+    """
+    global _radio_model_lines
+    if _radio_model_lines is None:
+        lines = []
+        for idx, model in enumerate(get_radio_models(), 1):
+            heading = _MODEL_HEADING_TMPL % (idx, model['name'])
+            details = (
+                f"      Manufacturer: {model['manufacturer']}\n"
+                f"      Max Channels: {model['max_channels']} | Baudrate: {model['baudrate']}\n"
+                f"      CHIRP ID: {model['chirp_id']}\n"
+            )
+            if model.get('notes'):
+                details += f"      {Colors.DIM}Note: {model['notes']}{Colors.RESET}\n"
+            lines.append((model['name'], heading, details + "\n"))
+        _radio_model_lines = lines
+    return _radio_model_lines
+
+
 def get_selected_radio_model() -> Optional[Dict[str, any]]:
     """
     Get the currently selected radio model from config file
@@ -1230,9 +1537,9 @@ def create_backup_file(radio_model: str, port: str, frequencies: List[Dict] = No
             "serial_port": port,
             "backup_date": datetime.now().isoformat(),
             "backup_type": "configuration",
-            "frequencies": frequencies if frequencies else [],
             "csv_file": csv_file if csv_file else None,
-            "frequency_count": len(frequencies) if frequencies else 0
+            "frequency_count": len(frequencies) if frequencies else 0,
+            "frequencies": frequencies if frequencies else []
         }
         
         if csv_file and os.path.exists(csv_file):
@@ -1243,8 +1550,8 @@ def create_backup_file(radio_model: str, port: str, frequencies: List[Dict] = No
             except Exception as e:
                 print_status(f"Warning: Could not read CSV file for backup: {e}", "warning")
         
-        with open(backup_file, 'w') as f:
-            json.dump(backup_data, f, indent=2)
+        with open(backup_file, 'wb') as f:
+            f.write(_json_dumps_indented(backup_data))
         
         return backup_file
     except Exception as e:
@@ -1782,6 +2089,109 @@ def preview_upload(csv_file: str, radio_model: str, port: str, frequencies: List
     print(f"{Colors.WARNING}⚠  This preview shows what would be uploaded{Colors.RESET}\n")
 
 
+_BACKUP_META_DEFAULTS = {
+    'radio_model': 'Unknown',
+    'serial_port': 'Unknown',
+    'backup_date': 'Unknown',
+    'frequency_count': 0
+}
+_BACKUP_DATA_KEYS = ('frequencies', 'csv_content')
+_BACKUP_HEADER_READ_SIZE = 65536
+
+
+def _scan_backup_header(text: str) -> Optional[Dict]:
+    """
+    Pull the listing metadata out of the start of a backup file's JSON
+    
+    Walks the top-level object key by key and stops as soon as every metadata
+    field is known and a non-empty frequencies/csv_content value has been seen,
+    so the bulk data of a backup written metadata-first is never decoded.
+    
+    Returns:
+        Metadata dict, or None if the text is not a JSON object
+        
+    Raises:
+        ValueError: If the text ends before the metadata could be read
+    """
+    decoder = json.JSONDecoder()
+    idx = _JSON_WS_RE.match(text).end()
+    if text[idx:idx + 1] != '{':
+        return None
+    idx += 1
+    
+    meta = {}
+    has_data = False
+    while True:
+        idx = _JSON_WS_RE.match(text, idx).end()
+        if text[idx:idx + 1] == '}':
+            break
+        key, idx = decoder.raw_decode(text, idx)
+        idx = _JSON_WS_RE.match(text, idx).end()
+        if text[idx:idx + 1] != ':':
+            return None
+        idx = _JSON_WS_RE.match(text, idx + 1).end()
+        
+        if key in _BACKUP_DATA_KEYS and not has_data:
+            opener = text[idx:idx + 1]
+            first = text[_JSON_WS_RE.match(text, idx + 1).end():][:1]
+            if (opener == '[' and first not in (']', '')) or (opener == '"' and text[idx + 1:idx + 2] not in ('"', '')):
+                has_data = True
+                if len(meta) == len(_BACKUP_META_DEFAULTS):
+                    break
+        
+        value, idx = decoder.raw_decode(text, idx)
+        if key in _BACKUP_META_DEFAULTS:
+            meta[key] = value
+        elif key in _BACKUP_DATA_KEYS:
+            has_data = has_data or bool(value)
+        if has_data and len(meta) == len(_BACKUP_META_DEFAULTS):
+            break
+        
+        idx = _JSON_WS_RE.match(text, idx).end()
+        if text[idx:idx + 1] == ',':
+            idx += 1
+        elif text[idx:idx + 1] == '}':
+            break
+        else:
+            return None
+    
+    header = dict(_BACKUP_META_DEFAULTS, **meta)
+    header['has_data'] = has_data
+    return header
+
+
+def _read_backup_meta(backup_path: str) -> Optional[Dict]:
+    """
+    Read the listing metadata of a backup file
+    
+    Only the start of the file is parsed when the metadata precedes the bulk
+    data; otherwise the whole file is loaded.
+    
+    Returns:
+        Dict with radio_model, serial_port, backup_date, frequency_count and has_data,
+        or None if the file could not be read
+    """
+    try:
+        with open(backup_path, 'rb', buffering=_BACKUP_HEADER_READ_SIZE) as f:
+            head = f.read(_BACKUP_HEADER_READ_SIZE)
+            try:
+                header = _scan_backup_header(head.decode('utf-8', errors='ignore'))
+                if header is not None:
+                    return header
+            except ValueError:
+                pass
+            backup_data = _json_loads(head + f.read())
+        return {
+            'radio_model': backup_data.get('radio_model', 'Unknown'),
+            'serial_port': backup_data.get('serial_port', 'Unknown'),
+            'backup_date': backup_data.get('backup_date', 'Unknown'),
+            'frequency_count': backup_data.get('frequency_count', 0),
+            'has_data': bool(backup_data.get('frequencies') or backup_data.get('csv_content'))
+        }
+    except Exception:
+        return None
+
+
 def restore_from_backup(backup_file: str) -> bool:
     """
     Restore frequencies from backup file to handheld radio
@@ -1793,8 +2203,8 @@ def restore_from_backup(backup_file: str) -> bool:
         True if restore was successful, False otherwise
     """
     try:
-        with open(backup_file, 'r') as f:
-            backup_data = json.load(f)
+        with open(backup_file, 'rb') as f:
+            backup_data = _json_loads(f.read())
         
         radio_model = backup_data.get('radio_model', 'Unknown')
         port = backup_data.get('serial_port', 'Unknown')
@@ -2133,6 +2543,11 @@ def run_import_menu():
     input(f"\n{Colors.INFO}Press Enter to return to menu...{Colors.RESET}")
 
 
+# When a thread sets _status_capture.lines to a list, print_status appends to it
+# instead of printing, so worker threads can hand their output to the main thread
+_status_capture = threading.local()
+
+
 def print_status(message: str, status_type: str = "info"):
     colors = {
         "info": Colors.INFO,
@@ -2141,24 +2556,201 @@ def print_status(message: str, status_type: str = "info"):
         "error": Colors.ERROR
     }
     color = colors.get(status_type, Colors.INFO)
-    print(f"{color}[*] {message}{Colors.RESET}")
+    line = f"{color}[*] {message}{Colors.RESET}"
+    captured = getattr(_status_capture, 'lines', None)
+    if captured is not None:
+        captured.append(line)
+    else:
+        print(line)
 
 
-class RadioRefToChirp:
+def _call_capturing_status(lines: List[str], func, *args):
+    """
+    Call func with print_status output appended to lines instead of printed
+    
+    Used for work run on a background thread while the main thread owns the terminal.
+    The caller owns lines, so it can still print what was captured if it stops waiting.
+    
+    Returns:
+        The result of func
+    """
+    _status_capture.lines = lines
+    try:
+        return func(*args)
+    finally:
+        _status_capture.lines = None
+
+
+_GENERATED_CHANNEL = {
+    'Location': '', 'Name': '', 'Frequency': '', 'Duplex': '', 'Offset': '', 'Tone': '',
+    'rToneFreq': '', 'cToneFreq': '', 'DtcsCode': '', 'DtcsPolarity': '', 'RxDtcsCode': '',
+    'CrossMode': '', 'Mode': 'FM', 'TStep': '5.00', 'Skip': '', 'Comment': '', 'URCALL': '',
+    'RPT1CALL': '', 'RPT2CALL': '', 'DVCODE': ''
+}
+
+_GMRS_FRS_TABLE = (
+    (1, 462.5625, 'FRS/GMRS 1', '2W FRS / 5W GMRS'),
+    (2, 462.5875, 'FRS/GMRS 2', '2W FRS / 5W GMRS'),
+    (3, 462.6125, 'FRS/GMRS 3', '2W FRS / 5W GMRS'),
+    (4, 462.6375, 'FRS/GMRS 4', '2W FRS / 5W GMRS'),
+    (5, 462.6625, 'FRS/GMRS 5', '2W FRS / 5W GMRS'),
+    (6, 462.6875, 'FRS/GMRS 6', '2W FRS / 5W GMRS'),
+    (7, 462.7125, 'FRS/GMRS 7', '2W FRS / 5W GMRS'),
+    (8, 467.5625, 'FRS 8', '0.5W FRS only'),
+    (9, 467.5875, 'FRS 9', '0.5W FRS only'),
+    (10, 467.6125, 'FRS 10', '0.5W FRS only'),
+    (11, 467.6375, 'FRS 11', '0.5W FRS only'),
+    (12, 467.6625, 'FRS 12', '0.5W FRS only'),
+    (13, 467.6875, 'FRS 13', '0.5W FRS only'),
+    (14, 467.7125, 'FRS 14', '0.5W FRS only'),
+    (15, 462.5500, 'FRS/GMRS 15', '2W FRS / 50W GMRS'),
+    (16, 462.5750, 'FRS/GMRS 16', '2W FRS / 50W GMRS'),
+    (17, 462.6000, 'FRS/GMRS 17', '2W FRS / 50W GMRS'),
+    (18, 462.6250, 'FRS/GMRS 18', '2W FRS / 50W GMRS'),
+    (19, 462.6500, 'FRS/GMRS 19', '2W FRS / 50W GMRS'),
+    (20, 462.6750, 'FRS/GMRS 20', '2W FRS / 50W GMRS'),
+    (21, 462.7000, 'FRS/GMRS 21', '2W FRS / 50W GMRS'),
+    (22, 462.7250, 'FRS/GMRS 22', '2W FRS / 50W GMRS'),
+)
+
+# Read-only views so the shared rows can be handed out without copying
+_GMRS_FRS_CHANNELS = tuple(
+    MappingProxyType(dict(_GENERATED_CHANNEL, Name=name, Frequency=f"{frequency:.4f}", Comment=f"Channel {channel} - {power}"))
+    for channel, frequency, name, power in _GMRS_FRS_TABLE
+)
+
+_NOAA_WEATHER_FREQUENCIES = (162.400, 162.425, 162.450, 162.475, 162.500, 162.525, 162.550)
+
+_NOAA_WEATHER_COMMENT = "NOAA Weather Radio {frequency} MHz{location_note} - Test all frequencies to find active transmitter"
+
+_NOAA_WEATHER_CHANNELS = tuple(
+    MappingProxyType(dict(_GENERATED_CHANNEL, Name=f'NOAA WX {idx}', Frequency=f"{freq:.3f}",
+                          Comment=_NOAA_WEATHER_COMMENT.format(frequency=f"{freq:.3f}", location_note="")))
+    for idx, freq in enumerate(_NOAA_WEATHER_FREQUENCIES, 1)
+)
+
+
+class Freq:
+    """
+    Fixed-schema CHIRP row for scraped frequencies
+    
+    Supports the dict-style get/[]/keys access used by the exporters and filters,
+    so scraped rows and plain CSV/generated dicts can be handled interchangeably.
+    """
     
-    CHIRP_COLUMNS = [
+    __slots__ = (
         'Location', 'Name', 'Frequency', 'Duplex', 'Offset', 'Tone',
         'rToneFreq', 'cToneFreq', 'DtcsCode', 'DtcsPolarity', 'RxDtcsCode',
         'CrossMode', 'Mode', 'TStep', 'Skip', 'Comment', 'URCALL',
         'RPT1CALL', 'RPT2CALL', 'DVCODE'
-    ]
+    )
+    
+    def __init__(self, Location='', Name='', Frequency='', Duplex='', Offset='',
+                 Tone='', rToneFreq='', cToneFreq='', DtcsCode='', DtcsPolarity='',
+                 RxDtcsCode='', CrossMode='', Mode='', TStep='', Skip='', Comment='',
+                 URCALL='', RPT1CALL='', RPT2CALL='', DVCODE=''):
+        self.Location = Location
+        self.Name = Name
+        self.Frequency = Frequency
+        self.Duplex = Duplex
+        self.Offset = Offset
+        self.Tone = Tone
+        self.rToneFreq = rToneFreq
+        self.cToneFreq = cToneFreq
+        self.DtcsCode = DtcsCode
+        self.DtcsPolarity = DtcsPolarity
+        self.RxDtcsCode = RxDtcsCode
+        self.CrossMode = CrossMode
+        self.Mode = Mode
+        self.TStep = TStep
+        self.Skip = Skip
+        self.Comment = Comment
+        self.URCALL = URCALL
+        self.RPT1CALL = RPT1CALL
+        self.RPT2CALL = RPT2CALL
+        self.DVCODE = DVCODE
+    
+    def get(self, key: str, default=None):
+        return getattr(self, key) if key in _FREQ_FIELDS else default
+    
+    def __getitem__(self, key: str):
+        if key not in _FREQ_FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+    
+    def __setitem__(self, key: str, value):
+        if key not in _FREQ_FIELDS:
+            raise KeyError(key)
+        setattr(self, key, value)
+    
+    def __contains__(self, key) -> bool:
+        return key in _FREQ_FIELDS
+    
+    def __iter__(self):
+        return iter(self.__slots__)
+    
+    def __len__(self) -> int:
+        return len(self.__slots__)
+    
+    def keys(self):
+        return self.__slots__
+
+
+_FREQ_FIELDS = frozenset(Freq.__slots__)
+# Reads every column of a Freq in CHIRP order in one C-level call
+_freq_values = operator.attrgetter(*Freq.__slots__)
+
+
+class RadioRefToChirp:
     
-    def __init__(self):
+    CHIRP_COLUMNS = list(Freq.__slots__)
+    CHIRP_HEADER_LINE = ','.join(CHIRP_COLUMNS) + '\r\n'
+    PAGE_CACHE_SIZE = 128
+    COUNTY_CACHE_FILE = "countyID.db"
+    CACHE_BUILD_WORKERS = 4
+    CACHE_CHECKPOINT_STATES = 10
+    # Longer than uszipcode plus the zippopotam (10s) and Nominatim (5s) fallbacks
+    ZIP_LOOKUP_TIMEOUT = 30
+    
+    def __init__(self, use_page_cache: bool = True):
         self.base_url = "https://www.radioreference.com"
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
         })
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(total=2, backoff_factor=0.3)
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self._county_cache = None
+        self._county_cache_mtime = None
+        self._county_cache_dirty = False
+        self._county_cache_lock = threading.RLock()
+        self._cache_by_state = defaultdict(dict)
+        self.use_page_cache = use_page_cache
+        self._page_cache = OrderedDict()
+        self._zip_cache = {}
+    
+    def clear_page_cache(self) -> int:
+        """
+        Forget pages and ZIP lookups cached during this session
+        
+        Returns:
+            Number of cached entries removed
+        """
+        removed = len(self._page_cache) + len(self._zip_cache)
+        self._page_cache.clear()
+        self._zip_cache.clear()
+        return removed
+    
+    def _remember_page(self, url: str, html: str):
+        self._page_cache[url] = html
+        self._page_cache.move_to_end(url)
+        while len(self._page_cache) > self.PAGE_CACHE_SIZE:
+            self._page_cache.popitem(last=False)
     
     def filter_frequencies(self, frequencies: List[Dict], filter_mode: Optional[str] = None) -> List[Dict]:
         if not filter_mode:
@@ -2283,86 +2875,36 @@ class RadioRefToChirp:
         state = state.upper()
         return self._fetch_via_scraping(state=state, county=county)
     
-    def generate_gmrs_frs_channels(self) -> List[Dict]:
+    def generate_gmrs_frs_channels(self, _frozen: bool = False) -> Sequence[Dict]:
         """
         Generate standard GMRS/FRS channel frequencies
         
+        Args:
+            _frozen: Return the shared read-only rows instead of mutable copies,
+                     for callers that never change them (e.g. Location)
+        
         Returns:
             List of frequency dictionaries for all 22 GMRS/FRS channels
+            (a tuple of read-only mappings when _frozen is set)
         """
-        channels = [
-            {'channel': 1, 'frequency': 462.5625, 'name': 'FRS/GMRS 1', 'power': '2W FRS / 5W GMRS'},
-            {'channel': 2, 'frequency': 462.5875, 'name': 'FRS/GMRS 2', 'power': '2W FRS / 5W GMRS'},
-            {'channel': 3, 'frequency': 462.6125, 'name': 'FRS/GMRS 3', 'power': '2W FRS / 5W GMRS'},
-            {'channel': 4, 'frequency': 462.6375, 'name': 'FRS/GMRS 4', 'power': '2W FRS / 5W GMRS'},
-            {'channel': 5, 'frequency': 462.6625, 'name': 'FRS/GMRS 5', 'power': '2W FRS / 5W GMRS'},
-            {'channel': 6, 'frequency': 462.6875, 'name': 'FRS/GMRS 6', 'power': '2W FRS / 5W GMRS'},
-            {'channel': 7, 'frequency': 462.7125, 'name': 'FRS/GMRS 7', 'power': '2W FRS / 5W GMRS'},
-            {'channel': 8, 'frequency': 467.5625, 'name': 'FRS 8', 'power': '0.5W FRS only'},
-            {'channel': 9, 'frequency': 467.5875, 'name': 'FRS 9', 'power': '0.5W FRS only'},
-            {'channel': 10, 'frequency': 467.6125, 'name': 'FRS 10', 'power': '0.5W FRS only'},
-            {'channel': 11, 'frequency': 467.6375, 'name': 'FRS 11', 'power': '0.5W FRS only'},
-            {'channel': 12, 'frequency': 467.6625, 'name': 'FRS 12', 'power': '0.5W FRS only'},
-            {'channel': 13, 'frequency': 467.6875, 'name': 'FRS 13', 'power': '0.5W FRS only'},
-            {'channel': 14, 'frequency': 467.7125, 'name': 'FRS 14', 'power': '0.5W FRS only'},
-            {'channel': 15, 'frequency': 462.5500, 'name': 'FRS/GMRS 15', 'power': '2W FRS / 50W GMRS'},
-            {'channel': 16, 'frequency': 462.5750, 'name': 'FRS/GMRS 16', 'power': '2W FRS / 50W GMRS'},
-            {'channel': 17, 'frequency': 462.6000, 'name': 'FRS/GMRS 17', 'power': '2W FRS / 50W GMRS'},
-            {'channel': 18, 'frequency': 462.6250, 'name': 'FRS/GMRS 18', 'power': '2W FRS / 50W GMRS'},
-            {'channel': 19, 'frequency': 462.6500, 'name': 'FRS/GMRS 19', 'power': '2W FRS / 50W GMRS'},
-            {'channel': 20, 'frequency': 462.6750, 'name': 'FRS/GMRS 20', 'power': '2W FRS / 50W GMRS'},
-            {'channel': 21, 'frequency': 462.7000, 'name': 'FRS/GMRS 21', 'power': '2W FRS / 50W GMRS'},
-            {'channel': 22, 'frequency': 462.7250, 'name': 'FRS/GMRS 22', 'power': '2W FRS / 50W GMRS'},
-        ]
-        
-        frequencies = []
-        for ch in channels:
-            freq_dict = {
-                'Location': '',
-                'Name': ch['name'],
-                'Frequency': f"{ch['frequency']:.4f}",
-                'Duplex': '',
-                'Offset': '',
-                'Tone': '',
-                'rToneFreq': '',
-                'cToneFreq': '',
-                'DtcsCode': '',
-                'DtcsPolarity': '',
-                'RxDtcsCode': '',
-                'CrossMode': '',
-                'Mode': 'FM',
-                'TStep': '5.00',
-                'Skip': '',
-                'Comment': f"Channel {ch['channel']} - {ch['power']}",
-                'URCALL': '',
-                'RPT1CALL': '',
-                'RPT2CALL': '',
-                'DVCODE': ''
-            }
-            frequencies.append(freq_dict)
-        
-        return frequencies
+        if _frozen:
+            return _GMRS_FRS_CHANNELS
+        return [dict(channel) for channel in _GMRS_FRS_CHANNELS]
     
-    def generate_noaa_weather_channels(self, location_info: Optional[Dict] = None) -> List[Dict]:
+    def generate_noaa_weather_channels(self, location_info: Optional[Dict] = None,
+                                       _frozen: bool = False) -> Sequence[Dict]:
         """
         Generate NOAA Weather Radio channel frequencies
         
         Args:
             location_info: Optional dict with 'state', 'county', 'city' for location-specific info
+            _frozen: Return read-only rows instead of mutable copies; without
+                     location info these are the shared rows, with no copying
             
         Returns:
             List of frequency dictionaries for all 7 NOAA weather channels
+            (a tuple of read-only mappings when _frozen is set)
         """
-        weather_frequencies = [
-            162.400,
-            162.425,
-            162.450,
-            162.475,
-            162.500,
-            162.525,
-            162.550
-        ]
-        
         location_note = ""
         if location_info:
             parts = []
@@ -2375,33 +2917,18 @@ class RadioRefToChirp:
             if parts:
                 location_note = f" for {', '.join(parts)}"
         
-        frequencies = []
-        for idx, freq in enumerate(weather_frequencies, 1):
-            freq_dict = {
-                'Location': '',
-                'Name': f'NOAA WX {idx}',
-                'Frequency': f"{freq:.3f}",
-                'Duplex': '',
-                'Offset': '',
-                'Tone': '',
-                'rToneFreq': '',
-                'cToneFreq': '',
-                'DtcsCode': '',
-                'DtcsPolarity': '',
-                'RxDtcsCode': '',
-                'CrossMode': '',
-                'Mode': 'FM',
-                'TStep': '5.00',
-                'Skip': '',
-                'Comment': f"NOAA Weather Radio {freq:.3f} MHz{location_note} - Test all frequencies to find active transmitter",
-                'URCALL': '',
-                'RPT1CALL': '',
-                'RPT2CALL': '',
-                'DVCODE': ''
-            }
-            frequencies.append(freq_dict)
+        if not location_note:
+            if _frozen:
+                return _NOAA_WEATHER_CHANNELS
+            return [dict(channel) for channel in _NOAA_WEATHER_CHANNELS]
         
-        return frequencies
+        channels = [
+            dict(channel, Comment=_NOAA_WEATHER_COMMENT.format(frequency=channel['Frequency'], location_note=location_note))
+            for channel in _NOAA_WEATHER_CHANNELS
+        ]
+        if _frozen:
+            return tuple(MappingProxyType(channel) for channel in channels)
+        return channels
     
     def _get_location_from_zip(self, zipcode: str) -> Optional[Dict]:
         """
@@ -2413,6 +2940,15 @@ class RadioRefToChirp:
         Returns:
             Dictionary with city, state, county info
         """
+        if self.use_page_cache and zipcode in self._zip_cache:
+            return dict(self._zip_cache[zipcode])
+        
+        location_info = self._resolve_location_from_zip(zipcode)
+        if location_info and self.use_page_cache:
+            self._zip_cache[zipcode] = dict(location_info)
+        return location_info
+    
+    def _resolve_location_from_zip(self, zipcode: str) -> Optional[Dict]:
         try:
             from uszipcode import SearchEngine
             search = SearchEngine()
@@ -2532,15 +3068,22 @@ class RadioRefToChirp:
                 url = f"{self.base_url}/apps/db/?stid={state_id}"
                 print_status(f"Fetching frequencies for {state}...", "info")
             
-            print_status("Connecting to Radio Reference...", "info")
-            response = self.session.get(url, timeout=15)
-            if response.status_code == 200:
-                print_status("Parsing frequency data...", "info")
-                frequencies = self._parse_html_response(response.text, state, county, city)
-                return frequencies
+            html = self._page_cache.get(url) if self.use_page_cache else None
+            if html is not None:
+                self._page_cache.move_to_end(url)
+                print_status("Using Radio Reference page cached earlier this session...", "info")
             else:
-                print_status(f"Failed to fetch page: HTTP {response.status_code}", "error")
-                return []
+                print_status("Connecting to Radio Reference...", "info")
+                response = self.session.get(url, timeout=15)
+                if response.status_code != 200:
+                    print_status(f"Failed to fetch page: HTTP {response.status_code}", "error")
+                    return []
+                html = response.text
+                if self.use_page_cache:
+                    self._remember_page(url, html)
+            
+            print_status("Parsing frequency data...", "info")
+            return self._parse_html_response(html, state, county, city)
                 
         except Exception as e:
             print_status(f"Error scraping: {e}", "error")
@@ -2600,86 +3143,189 @@ class RadioRefToChirp:
     
     def _load_county_cache(self) -> Dict[Tuple[str, str], str]:
         """
-        Load county ID cache from file
+        Load county ID cache, re-reading countyID.db only when its mtime changes
         
-        Supports both old flat format and new state-sectioned format
+        The returned dictionary is shared until the file is changed by
+        something other than this converter; use _cache_county_ids to add
+        entries so they are persisted. Unflushed entries are never dropped
+        by a reload.
         
         Returns:
             Dictionary mapping (county, state) -> county_id
         """
-        cache_file = "countyID.db"
-        if os.path.exists(cache_file):
-            try:
-                with open(cache_file, 'r', encoding='utf-8') as f:
-                    cache_data = json.load(f)
-                    
-                    cache = {}
-                    
-                    if isinstance(cache_data, dict) and any(isinstance(v, dict) for v in cache_data.values()):
-                        for state, counties in cache_data.items():
-                            if isinstance(counties, dict):
-                                for county, county_id in counties.items():
-                                    county_key = (county.lower(), state.lower())
-                                    cache[county_key] = str(county_id)
-                    else:
-                        for k, v in cache_data.items():
-                            if isinstance(k, list):
-                                cache[tuple(k)] = v
-                            elif isinstance(k, str) and '|' in k:
-                                parts = k.split('|', 1)
-                                if len(parts) == 2:
-                                    cache[(parts[0].lower(), parts[1].lower())] = v
-                            else:
-                                try:
-                                    cache[tuple(k)] = v
-                                except:
-                                    pass
-                    return cache
-            except Exception as e:
-                print_status(f"Error loading county cache: {e}", "warning")
-        return {}
+        with self._county_cache_lock:
+            mtime = self._get_county_cache_mtime()
+            if self._county_cache is None or (not self._county_cache_dirty and mtime != self._county_cache_mtime):
+                self._county_cache = self._read_county_cache_file()
+                self._county_cache_mtime = mtime
+                self._cache_by_state = defaultdict(dict)
+                for county_key, county_id in self._county_cache.items():
+                    if isinstance(county_key, tuple) and len(county_key) == 2:
+                        self._cache_by_state[county_key[1]][county_key[0]] = county_id
+            return self._county_cache
+    
+    def _get_county_cache_mtime(self) -> Optional[int]:
+        try:
+            return os.stat(self.COUNTY_CACHE_FILE).st_mtime_ns
+        except OSError:
+            return None
     
-    def _save_county_cache(self, cache: Dict[Tuple[str, str], str]):
+    def _get_county_cache_by_state(self) -> Dict[str, Dict[str, str]]:
         """
-        Save county ID cache to file
+        Get the cached county IDs grouped by state
         
-        Args:
-            cache: Dictionary mapping (county, state) -> county_id
+        Returns:
+            Dictionary mapping state -> {county: county_id}
         """
-        cache_file = "countyID.db"
-        try:
-            data = {}
-            for k, v in cache.items():
-                if isinstance(k, tuple) and len(k) == 2:
-                    county, state = k[0].lower(), k[1].upper()
-                    if state not in data:
-                        data[state] = {}
-                    data[state][county] = str(v)
-                elif isinstance(k, list) and len(k) == 2:
-                    county, state = k[0].lower(), k[1].upper()
-                    if state not in data:
-                        data[state] = {}
-                    data[state][county] = str(v)
-                elif isinstance(k, str) and '|' in k:
-                    parts = k.split('|', 1)
-                    if len(parts) == 2:
-                        county, state = parts[0].lower(), parts[1].upper()
-                        if state not in data:
-                            data[state] = {}
-                        data[state][county] = str(v)
-            
-            sorted_data = {}
-            for state in sorted(data.keys()):
-                sorted_data[state] = dict(sorted(data[state].items()))
-            
-            with open(cache_file, 'w', encoding='utf-8') as f:
-                json.dump(sorted_data, f, indent=2, ensure_ascii=False)
-        except Exception as e:
-            print_status(f"Failed to save county cache: {e}", "warning")
-            import traceback
-            traceback.print_exc()
+        self._load_county_cache()
+        return self._cache_by_state
     
-    def _get_known_counties_for_state(self, state: str) -> List[str]:
+    def _get_cached_counties_for_state(self, state: str) -> Dict[str, str]:
+        """
+        Get cached counties for a single state without scanning the whole cache
+        
+        Args:
+            state: State abbreviation
+            
+        Returns:
+            Dictionary mapping county -> county_id
+        """
+        self._load_county_cache()
+        return self._cache_by_state.get(state.lower(), {})
+    
+    def _read_county_cache_file(self) -> Dict[Tuple[str, str], str]:
+        """
+        Read county ID cache from file
+        
+        Supports both old flat format and new state-sectioned format
+        
+        Returns:
+            Dictionary mapping (county, state) -> county_id
+        """
+        cache_file = self.COUNTY_CACHE_FILE
+        if os.path.exists(cache_file):
+            try:
+                cache_data = _json_load_mapped(cache_file)
+                
+                cache = {}
+                
+                if isinstance(cache_data, dict) and any(isinstance(v, dict) for v in cache_data.values()):
+                    for state, counties in cache_data.items():
+                        if isinstance(counties, dict):
+                            for county, county_id in counties.items():
+                                county_key = (county.lower(), state.lower())
+                                cache[county_key] = str(county_id)
+                else:
+                    for k, v in cache_data.items():
+                        if isinstance(k, list):
+                            cache[tuple(k)] = v
+                        elif isinstance(k, str) and '|' in k:
+                            parts = k.split('|', 1)
+                            if len(parts) == 2:
+                                cache[(parts[0].lower(), parts[1].lower())] = v
+                        else:
+                            try:
+                                cache[tuple(k)] = v
+                            except:
+                                pass
+                return cache
+            except Exception as e:
+                print_status(f"Error loading county cache: {e}", "warning")
+        return {}
+    
+    def _save_county_cache(self, cache: Dict[Tuple[str, str], str]) -> bool:
+        """
+        Save county ID cache to file
+        
+        Args:
+            cache: Dictionary mapping (county, state) -> county_id
+            
+        Returns:
+            True if the file was written
+        """
+        with self._county_cache_lock:
+            cache_file = self.COUNTY_CACHE_FILE
+            try:
+                data = {}
+                for k, v in cache.items():
+                    if isinstance(k, tuple) and len(k) == 2:
+                        county, state = k[0].lower(), k[1].upper()
+                        if state not in data:
+                            data[state] = {}
+                        data[state][county] = str(v)
+                    elif isinstance(k, list) and len(k) == 2:
+                        county, state = k[0].lower(), k[1].upper()
+                        if state not in data:
+                            data[state] = {}
+                        data[state][county] = str(v)
+                    elif isinstance(k, str) and '|' in k:
+                        parts = k.split('|', 1)
+                        if len(parts) == 2:
+                            county, state = parts[0].lower(), parts[1].upper()
+                            if state not in data:
+                                data[state] = {}
+                            data[state][county] = str(v)
+                
+                sorted_data = {}
+                for state in sorted(data.keys()):
+                    sorted_data[state] = dict(sorted(data[state].items()))
+                
+                with open(cache_file, 'wb') as f:
+                    f.write(_json_dumps_indented(sorted_data))
+                if cache is self._county_cache:
+                    self._county_cache_mtime = self._get_county_cache_mtime()
+                return True
+            except Exception as e:
+                print_status(f"Failed to save county cache: {e}", "warning")
+                import traceback
+                traceback.print_exc()
+                return False
+    
+    def _cache_county_ids(self, entries: Dict[Tuple[str, str], str], _flush: bool = True) -> int:
+        """
+        Add county IDs to the cache and persist them in a single write
+        
+        Entries already cached with the same ID are skipped, and the file
+        is only rewritten when something actually changed.
+        
+        Args:
+            entries: Dictionary mapping (county, state) -> county_id
+            _flush: If False, only mark the cache dirty and leave the write
+                    to a later _flush_county_cache call
+            
+        Returns:
+            Number of entries added or updated
+        """
+        with self._county_cache_lock:
+            cache = self._load_county_cache()
+            changed = 0
+            for county_key, county_id in entries.items():
+                if cache.get(county_key) != county_id:
+                    cache[county_key] = county_id
+                    self._cache_by_state[county_key[1]][county_key[0]] = county_id
+                    changed += 1
+            
+            if changed:
+                # Stay dirty until a write succeeds so a later flush retries
+                self._county_cache_dirty = not (_flush and self._save_county_cache(cache))
+            return changed
+    
+    def _flush_county_cache(self) -> bool:
+        """
+        Write pending county cache changes to countyID.db
+        
+        Returns:
+            True if the cache was written
+        """
+        with self._county_cache_lock:
+            if not self._county_cache_dirty:
+                return False
+            if not self._save_county_cache(self._county_cache):
+                return False
+            self._county_cache_dirty = False
+            return True
+    
+    def _get_known_counties_for_state(self, state: str) -> List[str]:
         """
         Get a list of known county names for a state
         Uses a basic list - can be expanded with full US county database
@@ -3003,21 +3649,30 @@ class RadioRefToChirp:
         
         return discovered_counties
     
-    def _build_county_cache_for_state(self, state_id: str, state: str) -> Dict[Tuple[str, str], str]:
+    def _build_county_cache_for_state(self, state_id: str, state: str, _flush: bool = True,
+                                      _stop: Optional[threading.Event] = None) -> Dict[Tuple[str, str], str]:
         """
         Build county ID cache for a state by scraping Radio Reference
         
         Args:
             state_id: Radio Reference state ID
             state: State abbreviation
+            _flush: Passed to _cache_county_ids
+            _stop: Checked before each county or page probe; once set, discovery
+                   returns what it has found so far
             
         Returns:
             Dictionary mapping (county, state) -> county_id
         """
         cache = {}
+        if not HAS_BS4:
+            print_status("BeautifulSoup4 required. Install with: pip install beautifulsoup4", "error")
+            return cache
+        
+        def stopped() -> bool:
+            return _stop is not None and _stop.is_set()
+        
         try:
-            from bs4 import BeautifulSoup
-            
             print_status(f"Discovering county IDs for {state}...", "info")
             
             known_counties = self._get_known_counties_for_state(state)
@@ -3025,12 +3680,14 @@ class RadioRefToChirp:
             if known_counties:
                 print_status(f"Testing {len(known_counties)} known counties for {state}...", "info")
                 found = 0
+                existing_cache = self._load_county_cache()
                 
                 for county_name in known_counties:
+                    if stopped():
+                        break
                     county_clean = county_name.lower().replace(' county', '').strip()
                     county_key = (county_clean, state.lower())
                     
-                    existing_cache = self._load_county_cache()
                     if county_key in existing_cache:
                         cache[county_key] = existing_cache[county_key]
                         found += 1
@@ -3038,16 +3695,10 @@ class RadioRefToChirp:
                     
                     county_id = None
                     try:
-                        temp_cache = existing_cache.copy()
-                        if county_key in temp_cache:
-                            del temp_cache[county_key]
-                        
-                        from bs4 import BeautifulSoup
-                        
                         query_url = f"{self.base_url}/db/query/?stid={state_id}"
                         query_response = self.session.get(query_url, timeout=10)
                         if query_response.status_code == 200:
-                            query_soup = BeautifulSoup(query_response.text, 'html.parser')
+                            query_soup = BeautifulSoup(query_response.text, BS4_PARSER)
                             
                             for select in query_soup.find_all('select'):
                                 options = select.find_all('option')
@@ -3069,10 +3720,8 @@ class RadioRefToChirp:
                                                     test_url = f"{self.base_url}/db/browse/ctid/{value}"
                                                     test_resp = self.session.get(test_url, timeout=5)
                                                     if test_resp.status_code == 200:
-                                                        test_soup = BeautifulSoup(test_resp.text, 'html.parser')
-                                                        page_title = test_soup.find('h1') or test_soup.find('title')
-                                                        if page_title:
-                                                            title_text = page_title.get_text().lower()
+                                                        title_text = self._get_heading_text(test_resp.text, ('h1', 'title')).lower()
+                                                        if title_text:
                                                             if county_clean in title_text and state.lower() in title_text:
                                                                 county_id = value
                                                                 break
@@ -3094,6 +3743,8 @@ class RadioRefToChirp:
                     dropdown_state_id = state_id
                     print_status(f"Warning: No dropdown state ID found for {state}, using regular state ID {state_id}", "warning")
                 
+                if stopped():
+                    return cache
                 discovered_counties = self._extract_counties_with_playwright(dropdown_state_id, state)
                 
                 if not discovered_counties:
@@ -3104,6 +3755,8 @@ class RadioRefToChirp:
                     
                     if base_id:
                         for offset in range(-10, 11):
+                            if stopped():
+                                break
                             if offset == 0:
                                 continue
                             test_id = str(base_id + offset)
@@ -3124,9 +3777,7 @@ class RadioRefToChirp:
                 
                 if discovered_counties:
                     cache.update(discovered_counties)
-                    existing_cache = self._load_county_cache()
-                    existing_cache.update(discovered_counties)
-                    self._save_county_cache(existing_cache)
+                    self._cache_county_ids(discovered_counties, _flush=_flush)
                     
                     detected_states = set(county_key[1].upper() for county_key in discovered_counties.keys())
                     if len(detected_states) == 1:
@@ -3144,6 +3795,8 @@ class RadioRefToChirp:
                     print_status(f"Playwright couldn't extract counties from tree structure", "info")
                     print_status(f"Counties will be cached incrementally as they are searched", "info")
                     discovered_counties = {}
+                    if stopped():
+                        return cache
                 
                 browse_url = f"{self.base_url}/db/browse/?stid={state_id}"
                 
@@ -3155,6 +3808,8 @@ class RadioRefToChirp:
                 
                 try:
                     for api_url in api_endpoints:
+                        if stopped():
+                            return cache
                         try:
                             api_response = self.session.get(api_url, timeout=10)
                             if api_response.status_code == 200:
@@ -3183,8 +3838,9 @@ class RadioRefToChirp:
                     response = self.session.get(browse_url, timeout=15)
                     
                     if response.status_code == 200:
-                        soup = BeautifulSoup(response.text, 'html.parser')
+                        soup = BeautifulSoup(response.text, BS4_PARSER)
                         page_text = response.text
+                        pt_lower = page_text.lower()
                         
                         for link in soup.find_all('a', href=True):
                             href = link.get('href', '')
@@ -3224,33 +3880,18 @@ class RadioRefToChirp:
                                                 break
                         
                         for county_name in unique_county_names:
-                            county_full = county_name + ' County'
-                            occurrences = [m.start() for m in re.finditer(re.escape(county_full), page_text, re.I)]
+                            county_full = county_name.lower() + ' county'
+                            occurrences = [m.start() for m in re.finditer(re.escape(county_full), pt_lower)]
                             
                             for county_index in occurrences:
-                                nearby_text = page_text[max(0, county_index-2000):county_index+2000]
-                                
-                                ctid_patterns = [
-                                    r'ctid["\']?\s*[:=]\s*["\']?(\d+)',
-                                    r'ctid[/=](\d+)',
-                                    r'["\']id["\']\s*:\s*["\']?(\d+)',
-                                    r'id["\']?\s*:\s*["\']?(\d+)',
-                                    r'value["\']?\s*:\s*["\']?(\d+)',
-                                ]
-                                
-                                for pattern in ctid_patterns:
-                                    ctid_match = re.search(pattern, nearby_text, re.I)
-                                    if ctid_match:
-                                        county_id = ctid_match.group(1)
-                                        if county_id.isdigit() and len(county_id) >= 3 and len(county_id) <= 5:
-                                            county_clean = county_name.strip().lower()
-                                            county_key = (county_clean, state.lower())
-                                            discovered_counties[county_key] = county_id
-                                            break
-                                if county_key in discovered_counties:
+                                ctid_match = _CTID_COMBINED_RE.search(pt_lower, max(0, county_index-2000), county_index+2000)
+                                if ctid_match:
+                                    county_clean = county_name.strip().lower()
+                                    county_key = (county_clean, state.lower())
+                                    discovered_counties[county_key] = ctid_match['id']
                                     break
                         
-                        county_ctid_patterns = re.findall(r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+County[^<]*ctid[/=](\d+)', page_text, re.I)
+                        county_ctid_patterns = re.findall(r'([a-z]+(?:\s+[a-z]+)*)\s+county[^<]*ctid[/=](\d+)', pt_lower)
                         for county_name, county_id in county_ctid_patterns:
                             county_clean = county_name.strip().lower()
                             county_key = (county_clean, state.lower())
@@ -3260,18 +3901,18 @@ class RadioRefToChirp:
                         for script in scripts:
                             script_text = script.string or ''
                             if script_text and len(script_text) > 100:
-                                script_counties = re.findall(r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+County', script_text)
-                                for county_name in set(script_counties):
-                                    county_index = script_text.find(county_name + ' County')
-                                    if county_index != -1:
-                                        nearby_script = script_text[max(0, county_index-300):county_index+300]
-                                        ctid_match = re.search(r'ctid["\']?\s*[:=]\s*["\']?(\d+)', nearby_script, re.I)
-                                        if ctid_match:
-                                            county_id = ctid_match.group(1)
-                                            if county_id.isdigit() and len(county_id) >= 3:
-                                                county_clean = county_name.strip().lower()
-                                                county_key = (county_clean, state.lower())
-                                                discovered_counties[county_key] = county_id
+                                script_counties = {}
+                                for county_match in re.finditer(r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+County', script_text):
+                                    script_counties.setdefault(county_match.group(1), county_match.start())
+                                for county_name, county_index in script_counties.items():
+                                    nearby_script = script_text[max(0, county_index-300):county_index+300]
+                                    ctid_match = re.search(r'ctid["\']?\s*[:=]\s*["\']?(\d+)', nearby_script, re.I)
+                                    if ctid_match:
+                                        county_id = ctid_match.group(1)
+                                        if county_id.isdigit() and len(county_id) >= 3:
+                                            county_clean = county_name.strip().lower()
+                                            county_key = (county_clean, state.lower())
+                                            discovered_counties[county_key] = county_id
                 except Exception as e:
                     pass
                 
@@ -3361,13 +4002,16 @@ class RadioRefToChirp:
         except Exception as e:
             return True
     
-    def build_county_cache_for_state(self, state: str, use_search: bool = True) -> int:
+    def build_county_cache_for_state(self, state: str, use_search: bool = True, _flush: bool = True,
+                                     _stop: Optional[threading.Event] = None) -> int:
         """
         Build county ID cache for a specific state
         
         Args:
             state: State abbreviation (e.g., 'CA')
             use_search: If True, use search methods to find counties incrementally
+            _flush: If False, leave new entries unsaved for the caller to flush
+            _stop: If set while running, return early with the counties cached so far
             
         Returns:
             Number of counties found and cached
@@ -3379,18 +4023,21 @@ class RadioRefToChirp:
         
         print_status(f"Building county cache for {state}...", "info")
         
-        existing_cache = self._load_county_cache()
-        state_counties = {k: v for k, v in existing_cache.items() if k[1] == state.lower()}
+        # Snapshot the keys now: discovery below adds to the shared cache dict
+        previously_cached = set(self._load_county_cache())
+        already_cached = len(self._get_cached_counties_for_state(state))
         
-        if state_counties:
-            print_status(f"Found {len(state_counties)} counties already cached for {state}", "info")
+        if already_cached:
+            print_status(f"Found {already_cached} counties already cached for {state}", "info")
         
         new_counties = 0
         
         if use_search:
             print_status(f"Discovering county IDs for {state}...", "info")
             
-            discovered_cache = self._build_county_cache_for_state(state_id, state)
+            discovered_cache = self._build_county_cache_for_state(state_id, state, _flush=_flush, _stop=_stop)
+            if _stop is not None and _stop.is_set():
+                return len(self._get_cached_counties_for_state(state))
             
             if discovered_cache:
                 discovered_ids = set(discovered_cache.values())
@@ -3421,33 +4068,29 @@ class RadioRefToChirp:
                 if verification_rate >= 0.8:
                     print_status(f"Sample verification passed ({verified_count}/{sample_size} verified). Caching all {len(discovered_cache)} counties...", "success")
                     
-                    for county_key, county_id in discovered_cache.items():
-                        if county_key not in existing_cache:
-                            existing_cache[county_key] = county_id
-                            new_counties += 1
-                    
-                    self._save_county_cache(existing_cache)
+                    new_entries = {k: v for k, v in discovered_cache.items() if k not in previously_cached}
+                    self._cache_county_ids(new_entries, _flush=_flush)
+                    new_counties = len(new_entries)
                     verified = len(discovered_cache)
                 else:
                     print_status(f"Sample verification failed ({verified_count}/{sample_size} verified). Counties may not be accurate for this state.", "warning")
                     verified = 0
                 
                 if new_counties > 0:
-                    self._save_county_cache(existing_cache)
                     if detected_state != state.upper():
                         print_status(f"Added {new_counties} new counties to cache for {detected_state} ({verified} total counties cached)", "success")
                     else:
                         print_status(f"Added {new_counties} new counties to cache for {state} ({verified} total counties cached)", "success")
                 else:
                     if detected_state != state.upper():
-                        detected_state_counties = {k: v for k, v in existing_cache.items() if k[1] == detected_state.lower()}
-                        if detected_state_counties:
-                            print_status(f"No new counties found for {detected_state} (already had {len(detected_state_counties)} cached)", "info")
+                        detected_cached = len(self._get_cached_counties_for_state(detected_state))
+                        if detected_cached:
+                            print_status(f"No new counties found for {detected_state} (already had {detected_cached} cached)", "info")
                         else:
                             print_status(f"Cached {verified} counties for {detected_state}", "info")
                     else:
-                        if state_counties:
-                            print_status(f"No new counties found for {state} (already had {len(state_counties)} cached)", "info")
+                        if already_cached:
+                            print_status(f"No new counties found for {state} (already had {already_cached} cached)", "info")
                         else:
                             print_status(f"Cached {verified} counties for {state}", "info")
             else:
@@ -3458,12 +4101,12 @@ class RadioRefToChirp:
             detected_states = set(k[1].upper() for k in discovered_cache.keys())
             if detected_states:
                 detected_state = list(detected_states)[0]
-                total_counties = len({k: v for k, v in existing_cache.items() if k[1] == detected_state.lower()})
+                total_counties = len(self._get_cached_counties_for_state(detected_state))
                 if detected_state != state.upper():
                     print_status(f"Total counties cached for {detected_state}: {total_counties}", "success")
                 return total_counties
         
-        total_counties = len({k: v for k, v in existing_cache.items() if k[1] == state.lower()})
+        total_counties = len(self._get_cached_counties_for_state(state))
         return total_counties
     
     def build_county_cache_for_all_states(self) -> Dict[str, int]:
@@ -3503,36 +4146,85 @@ class RadioRefToChirp:
         
         print_status(f"Building county cache for all {len(all_states)} states/territories...", "info")
         print_status("This may take a while. Progress will be shown for each state.", "info")
-        print_status("Rate limiting is enabled to avoid overwhelming the server (0.5s between counties, 2s between states).", "info")
+        print_status(f"Rate limiting is enabled to avoid overwhelming the server (0.5s between counties, 2s between states, {self.CACHE_BUILD_WORKERS} states at a time).", "info")
         print_status("Each state will be checked on Radio Reference's website.", "info")
         
-        for idx, state in enumerate(all_states, 1):
-            print(f"\n{Colors.HEADER}[{idx}/{len(all_states)}]{Colors.RESET} Processing {state}...")
-            
-            state_id = self._get_state_id(state)
-            if not state_id:
-                print_status(f"Warning: No state ID found for {state}, skipping...", "warning")
-                results[state] = 0
-                continue
-            
-            count = self.build_county_cache_for_state(state, use_search=True)
-            
-            cache = self._load_county_cache()
-            state_counties = {k: v for k, v in cache.items() if k[1] == state.lower()}
-            actual_count = len(state_counties)
-            
-            if actual_count != count and actual_count > 0:
-                count = actual_count
-            
-            results[state] = count
-            total_counties += count
-            processed_states.add(state)
+        stop_event = threading.Event()
+        
+        def build_state(idx_state, lines):
+            """Build one state, appending its status lines for the main thread to print"""
+            idx, state = idx_state
+            lines.append(f"\n{Colors.HEADER}[{idx}/{len(all_states)}]{Colors.RESET} Processing {state}...")
+            if stop_event.is_set():
+                return state, 0, False
             
-            print(f"{Colors.SUCCESS}✓ {state}: {count} counties found and cached (saved to countyID.db){Colors.RESET}")
-            print(f"{Colors.INFO}  Total progress: {total_counties} counties cached across {len(processed_states)} states{Colors.RESET}")
+            _status_capture.lines = lines
+            try:
+                state_id = self._get_state_id(state)
+                if not state_id:
+                    print_status(f"Warning: No state ID found for {state}, skipping...", "warning")
+                    return state, 0, False
+                
+                count = self.build_county_cache_for_state(state, use_search=True, _flush=False, _stop=stop_event)
+                
+                actual_count = len(self._get_cached_counties_for_state(state))
+                
+                if actual_count != count and actual_count > 0:
+                    count = actual_count
+            finally:
+                _status_capture.lines = None
             
-            if idx < len(all_states):
-                time.sleep(2)
+            stop_event.wait(2)
+            return state, count, True
+        
+        interrupted = False
+        executor = ThreadPoolExecutor(max_workers=self.CACHE_BUILD_WORKERS)
+        try:
+            state_lines = [[] for _ in all_states]
+            futures = [executor.submit(build_state, item, lines)
+                       for item, lines in zip(enumerate(all_states, 1), state_lines)]
+            for future, lines in zip(futures, state_lines):
+                # Poll so Ctrl-C is handled while a slow state is still running,
+                # echoing the oldest state's progress as it is captured
+                printed = 0
+                while True:
+                    try:
+                        state, count, processed = future.result(timeout=0.5)
+                        break
+                    except FuturesTimeoutError:
+                        pass
+                    finally:
+                        new_lines = lines[printed:]
+                        if new_lines:
+                            print("\n".join(new_lines))
+                            printed += len(new_lines)
+                results[state] = count
+                if not processed:
+                    continue
+                total_counties += count
+                processed_states.add(state)
+                
+                print(f"{Colors.SUCCESS}✓ {state}: {count} counties found and cached{Colors.RESET}")
+                print(f"{Colors.INFO}  Total progress: {total_counties} counties cached across {len(processed_states)} states{Colors.RESET}")
+                
+                if len(processed_states) % self.CACHE_CHECKPOINT_STATES == 0 and self._flush_county_cache():
+                    print(f"{Colors.DIM}  Checkpoint saved to countyID.db{Colors.RESET}")
+        except KeyboardInterrupt:
+            # Queued states are cancelled and running ones stop at their next
+            # county; wait for them so nothing is cached after the final flush
+            interrupted = True
+            stop_event.set()
+            print()
+            print_status("Cache build interrupted. Stopping...", "warning")
+        finally:
+            executor.shutdown(wait=True, cancel_futures=interrupted)
+            if self._flush_county_cache():
+                print_status("County cache saved to countyID.db", "success")
+        
+        if interrupted:
+            print_status(f"Stopped after {len(processed_states)}/{len(all_states)} states.", "warning")
+            print_status(f"Total counties cached: {total_counties}", "success")
+            return results
         
         unprocessed = expected_states - processed_states
         if unprocessed:
@@ -3574,6 +4266,23 @@ class RadioRefToChirp:
         
         return None
     
+    def _get_heading_text(self, html: str, tags: Tuple[str, ...] = ('h1',)) -> str:
+        """
+        Get the text of the first matching heading without building a soup
+        
+        Args:
+            html: Raw page HTML
+            tags: Heading tags to try in order ('h1', 'h2', 'title')
+            
+        Returns:
+            Heading text, or an empty string if none of the tags are present
+        """
+        for tag in tags:
+            match = _HEADING_RES[tag].search(html)
+            if match:
+                return html_lib.unescape(_TAG_RE.sub('', match.group(1)))
+        return ''
+    
     def _get_county_id(self, state_id: str, state: str, county: str) -> Optional[str]:
         """
         Get county ID by multiple methods
@@ -3593,20 +4302,20 @@ class RadioRefToChirp:
         
         cache = self._load_county_cache()
         if state_id:
-            state_counties = {k: v for k, v in cache.items() if k[1] == state.lower()}
-            if not state_counties:
+            if not self._get_cached_counties_for_state(state):
                 new_cache = self._build_county_cache_for_state(state_id, state)
                 if new_cache:
-                    cache.update(new_cache)
-                    self._save_county_cache(cache)
+                    # Only the Playwright path persists its own results; this stores the
+                    # known-county and browse-page ones and skips what is already saved
+                    added = self._cache_county_ids(new_cache)
+                    if added:
+                        print_status(f"Cached {added} new county IDs for {state}", "info")
                     county_key = (county.lower().replace(' county', '').strip(), state.lower())
-                    if county_key in cache:
-                        print_status(f"Found county ID in new cache: {cache[county_key]}", "success")
-                        return cache[county_key]
+                    if county_key in new_cache:
+                        print_status(f"Found county ID in new cache: {new_cache[county_key]}", "success")
+                        return new_cache[county_key]
         
-        try:
-            from bs4 import BeautifulSoup
-        except ImportError:
+        if not HAS_BS4:
             print_status("BeautifulSoup4 required. Install with: pip install beautifulsoup4", "error")
             return None
         
@@ -3618,9 +4327,6 @@ class RadioRefToChirp:
             query_url = f"{self.base_url}/db/query/?stid={state_id}"
             query_response = self.session.get(query_url, timeout=10)
             if query_response.status_code == 200:
-                query_soup = BeautifulSoup(query_response.text, 'html.parser')
-                
-                
                 page_text = query_response.text
                 
                 ctid_name_patterns = re.findall(r'ctid["\']?\s*[:=]\s*["\']?(\d+)["\']?[^}]*?name["\']?\s*[:=]\s*["\']([^"\']+county[^"\']*)', page_text, re.I)
@@ -3631,9 +4337,8 @@ class RadioRefToChirp:
                         test_url = f"{self.base_url}/db/browse/ctid/{ctid}"
                         test_resp = self.session.get(test_url, timeout=5)
                         if test_resp.status_code == 200:
-                            test_soup = BeautifulSoup(test_resp.text, 'html.parser')
-                            h1 = test_soup.find('h1')
-                            if h1 and state.upper() in h1.get_text():
+                            h1_text = self._get_heading_text(test_resp.text)
+                            if state.upper() in h1_text:
                                 county_id = ctid
                                 break
                 
@@ -3650,10 +4355,8 @@ class RadioRefToChirp:
                             test_url = f"{self.base_url}/db/browse/ctid/{ctid}"
                             test_resp = self.session.get(test_url, timeout=5)
                             if test_resp.status_code == 200:
-                                test_soup = BeautifulSoup(test_resp.text, 'html.parser')
-                                h1 = test_soup.find('h1')
-                                if h1:
-                                    title_text = h1.get_text()
+                                title_text = self._get_heading_text(test_resp.text)
+                                if title_text:
                                     if state.upper() in title_text and county_clean in title_text.lower():
                                         county_id = ctid
                                         break
@@ -3661,9 +4364,7 @@ class RadioRefToChirp:
                 if county_id:
                     print_status(f"Found county ID: {county_id} ({county})", "success")
                     county_key = (county_clean, state.lower())
-                    cache = self._load_county_cache()
-                    cache[county_key] = county_id
-                    self._save_county_cache(cache)
+                    self._cache_county_ids({county_key: county_id})
                     return county_id
         except:
             pass
@@ -3677,7 +4378,7 @@ class RadioRefToChirp:
             try:
                 response = self.session.get(url, timeout=10)
                 if response.status_code == 200:
-                    soup = BeautifulSoup(response.text, 'html.parser')
+                    soup = BeautifulSoup(response.text, BS4_PARSER)
                     
                     for link in soup.find_all('a', href=True):
                         href = link.get('href', '')
@@ -3692,14 +4393,11 @@ class RadioRefToChirp:
                                 try:
                                     test_resp = self.session.get(test_url, timeout=5)
                                     if test_resp.status_code == 200:
-                                        test_soup = BeautifulSoup(test_resp.text, 'html.parser')
-                                        h1 = test_soup.find('h1')
-                                        if h1 and county_clean in h1.get_text().lower():
+                                        h1_text = self._get_heading_text(test_resp.text)
+                                        if county_clean in h1_text.lower():
                                             print_status(f"Found county ID: {county_id} ({link.get_text(strip=True)})", "success")
                                             county_key = (county_clean, state.lower())
-                                            cache = self._load_county_cache()
-                                            cache[county_key] = county_id
-                                            self._save_county_cache(cache)
+                                            self._cache_county_ids({county_key: county_id})
                                             return county_id
                                 except:
                                     pass
@@ -3720,17 +4418,13 @@ class RadioRefToChirp:
                     try:
                         test_resp = self.session.get(test_url, timeout=5)
                         if test_resp.status_code == 200:
-                            test_soup = BeautifulSoup(test_resp.text, 'html.parser')
-                            heading = test_soup.find('h1') or test_soup.find('h2') or test_soup.find('title')
-                            if heading:
-                                heading_text = heading.get_text().lower()
+                            heading_text = self._get_heading_text(test_resp.text, ('h1', 'h2', 'title')).lower()
+                            if heading_text:
                                 if county_clean in heading_text and state.lower() in heading_text:
                                     county_id = ctid
                                     print_status(f"Found county ID in page source: {county_id}", "success")
                                     county_key = (county_clean, state.lower())
-                                    cache = self._load_county_cache()
-                                    cache[county_key] = county_id
-                                    self._save_county_cache(cache)
+                                    self._cache_county_ids({county_key: county_id})
                                     return county_id
                     except:
                         continue
@@ -3741,14 +4435,14 @@ class RadioRefToChirp:
     
     def _parse_html_response(self, html: str, state: str, county: Optional[str] = None,
                             city: Optional[str] = None) -> List[Dict]:
-        try:
-            from bs4 import BeautifulSoup
-        except ImportError:
+        if not HAS_BS4:
             print_status("BeautifulSoup4 required for scraping. Install with: pip install beautifulsoup4", "error")
             return []
         
         frequencies = []
-        soup = BeautifulSoup(html, 'html.parser')
+        tone_memo = {}
+        mode_memo = {}
+        soup = BeautifulSoup(html, BS4_PARSER)
         
         tables = soup.find_all('table')
         
@@ -3782,121 +4476,121 @@ class RadioRefToChirp:
                 elif 'type' in header:
                     col_map['type'] = idx
             
+            freq_idx = col_map.get('frequency', -1)
+            alpha_idx = col_map.get('alpha_tag', -1)
+            desc_idx = col_map.get('description', -1)
+            tone_idx = col_map.get('tone', -1)
+            mode_idx = col_map.get('mode', -1)
+            type_idx = col_map.get('type', -1)
+            
             for row in rows[1:]:
                 cells = row.find_all(['td', 'th'])
-                if len(cells) < 2:
+                n_cells = len(cells)
+                if n_cells < 2:
                     continue
                 
-                freq_text = ''
-                if 'frequency' in col_map and col_map['frequency'] < len(cells):
-                    freq_text = cells[col_map['frequency']].get_text(strip=True)
-                elif len(cells) > 0:
+                if 0 <= freq_idx < n_cells:
+                    freq_text = cells[freq_idx].get_text(strip=True)
+                else:
                     freq_text = cells[0].get_text(strip=True)
                 
-                freq_match = re.search(r'(\d+\.\d+)', freq_text)
+                freq_match = _FREQ_RE.search(freq_text)
                 if not freq_match:
                     continue
                 
                 frequency = freq_match.group(1)
                 
-                name = ''
-                if 'alpha_tag' in col_map and col_map['alpha_tag'] < len(cells):
-                    name = cells[col_map['alpha_tag']].get_text(strip=True)
-                elif 'description' in col_map and col_map['description'] < len(cells):
-                    name = cells[col_map['description']].get_text(strip=True)
+                description = ''
+                if 0 <= desc_idx < n_cells:
+                    description = cells[desc_idx].get_text(strip=True)
                 
-                tone_text = ''
-                if 'tone' in col_map and col_map['tone'] < len(cells):
-                    tone_text = cells[col_map['tone']].get_text(strip=True)
+                if 0 <= alpha_idx < n_cells:
+                    name = cells[alpha_idx].get_text(strip=True)
+                else:
+                    name = description
                 
-                tone_type, r_tone, c_tone = self._parse_tone(tone_text)
+                tone_text = ''
+                if 0 <= tone_idx < n_cells:
+                    tone_text = cells[tone_idx].get_text(strip=True)
                 
-                description = ''
-                if 'description' in col_map and col_map['description'] < len(cells):
-                    description = cells[col_map['description']].get_text(strip=True)
+                tone = tone_memo.get(tone_text)
+                if tone is None:
+                    tone = tone_memo[tone_text] = self._parse_tone(tone_text)
+                tone_type, r_tone, c_tone = tone
                 
-                mode = 'FM'
-                if 'mode' in col_map and col_map['mode'] < len(cells):
-                    mode_text = cells[col_map['mode']].get_text(strip=True).upper()
-                    if 'P25' in mode_text or 'DIGITAL' in mode_text:
-                        mode = 'Digital'
-                    elif 'DMR' in mode_text:
-                        mode = 'DMR'
-                    elif 'NXDN' in mode_text:
-                        mode = 'NXDN'
-                    elif 'FMN' in mode_text or 'FM' in mode_text:
-                        mode = 'FM'
+                mode = _MODE_FM
+                if 0 <= mode_idx < n_cells:
+                    mode_text = cells[mode_idx].get_text(strip=True).upper()
+                    mode = mode_memo.get(mode_text)
+                    if mode is None:
+                        mode = mode_memo[mode_text] = self._classify_mode(mode_text)
                 
                 duplex = ''
                 offset = ''
-                if 'type' in col_map and col_map['type'] < len(cells):
-                    type_text = cells[col_map['type']].get_text(strip=True).upper()
-                    if 'RM' in type_text or 'REPEATER' in type_text:
-                        freq_val = float(frequency)
-                        if 144 <= freq_val <= 148:
-                            duplex = '+'
-                            offset = '0.6'
-                        elif 440 <= freq_val <= 450:
-                            duplex = '+'
-                            offset = '5.0'
-                        elif 150 <= freq_val <= 160:
-                            duplex = '+'
-                            offset = '0.0'
-                    elif 'BM' in type_text or 'BASE' in type_text:
-                        duplex = ''
+                if 0 <= type_idx < n_cells:
+                    type_text = cells[type_idx].get_text(strip=True).upper()
+                    if _REPEATER_TYPE_RE.search(type_text):
+                        duplex, offset = _band_for(float(frequency))
                 
-                freq = {
-                    'Location': str(len(frequencies)),
-                    'Name': name or description or f"Frequency {frequency}",
-                    'Frequency': frequency,
-                    'Duplex': duplex,
-                    'Offset': offset,
-                    'Tone': tone_type,
-                    'rToneFreq': r_tone,
-                    'cToneFreq': c_tone,
-                    'DtcsCode': '',
-                    'DtcsPolarity': 'NN',
-                    'RxDtcsCode': '',
-                    'CrossMode': '',
-                    'Mode': mode,
-                    'TStep': '25.0',
-                    'Skip': '',
-                    'Comment': description or f"{county or state} - {name}" if name else '',
-                    'URCALL': '',
-                    'RPT1CALL': '',
-                    'RPT2CALL': '',
-                    'DVCODE': ''
-                }
+                if description:
+                    comment = description
+                elif name:
+                    comment = f"{county or state} - {name}"
+                else:
+                    comment = ''
+                
+                freq = Freq(
+                    Location=str(len(frequencies)),
+                    Name=name or description or f"Frequency {frequency}",
+                    Frequency=frequency,
+                    Duplex=duplex,
+                    Offset=offset,
+                    Tone=tone_type,
+                    rToneFreq=r_tone,
+                    cToneFreq=c_tone,
+                    DtcsPolarity=_POL_NN,
+                    Mode=mode,
+                    TStep=_TSTEP_25,
+                    Comment=comment
+                )
                 frequencies.append(freq)
         
         return frequencies
     
+    def _classify_mode(self, mode_text: str) -> str:
+        """
+        Classify an uppercased mode cell, preferring Digital over DMR, NXDN and FM
+        
+        Returns:
+            CHIRP mode name, 'FM' if nothing matches
+        """
+        found_modes = {m.lastgroup for m in _MODE_RE.finditer(mode_text)}
+        return next((m for m in _MODE_PRIORITY if m in found_modes), _MODE_FM)
+    
     def _parse_tone(self, tone_text: str) -> tuple:
         """
         Parse tone information
         
+        The first number in the cell is the tone; a DCS/DTCS marker anywhere
+        in the cell makes it a DTCS code.
+        
         Returns:
             Tuple of (tone_type, rToneFreq, cToneFreq)
         """
         if not tone_text:
-            return ('No Tone', '', '')
-        
-        tone_text = tone_text.upper().strip()
-        
-        tone_match = re.search(r'(\d+\.?\d*)', tone_text)
-        if tone_match:
-            tone_freq = tone_match.group(1)
-            if 'DCS' in tone_text or 'DTCS' in tone_text:
-                return ('DTCS', tone_freq, tone_freq)
-            else:
-                return ('Tone', tone_freq, tone_freq)
-        
-        if 'DCS' in tone_text or 'DTCS' in tone_text:
-            dcs_match = re.search(r'(\d+)', tone_text)
-            if dcs_match:
-                return ('DTCS', dcs_match.group(1), dcs_match.group(1))
-        
-        return ('No Tone', '', '')
+            return _NO_TONE_TRIPLE
+        
+        tone_freq = None
+        is_dcs = False
+        for match in _TONE_COMBO_RE.finditer(tone_text):
+            if match.lastgroup == 'dcs':
+                is_dcs = True
+            elif tone_freq is None:
+                tone_freq = match.group('num')
+        
+        if tone_freq is None:
+            return _NO_TONE_TRIPLE
+        return ('DTCS' if is_dcs else 'Tone', tone_freq, tone_freq)
     
     def _parse_duplex_offset(self, freq_text: str, cells: List) -> tuple:
         """
@@ -3917,20 +4611,70 @@ class RadioRefToChirp:
         
         for cell in cells:
             text = cell.get_text(strip=True)
-            offset_match = re.search(r'([+-]?\d+\.?\d*)\s*(MHz|Mhz|mhz)?', text)
+            offset_match = _OFFSET_RE.search(text)
             if offset_match and ('offset' in text.lower() or 'split' in text.lower()):
                 offset = offset_match.group(1)
                 break
         
         if not offset and duplex:
-            freq_val = float(re.search(r'(\d+\.\d+)', freq_text).group(1))
-            if 144 <= freq_val <= 148:
-                offset = '0.6' if duplex == '+' else '-0.6'
-            elif 440 <= freq_val <= 450:
-                offset = '5.0' if duplex == '+' else '-5.0'
+            _, band_offset = _band_for(float(_FREQ_RE.search(freq_text).group(1)))
+            if band_offset and band_offset != '0.0':
+                offset = band_offset if duplex == '+' else f'-{band_offset}'
         
         return (duplex, offset)
     
+    def _last_location(self, csv_file: str) -> int:
+        """
+        Find the next free Location of an existing CHIRP CSV by reading only its header and last row
+        
+        Falls back to a full csv pass when the last physical line is not a
+        complete row (e.g. the end of a quoted multi-line Comment).
+        
+        Returns:
+            Last row's Location + 1, or 0 if the file has no data rows
+        """
+        with open(csv_file, 'rb') as f:
+            header_line = f.readline()
+            header = next(csv.reader([header_line.decode('utf-8')]), [])
+            if 'Location' not in header:
+                return 0
+            loc_idx = header.index('Location')
+            
+            data_start = len(header_line)
+            pos = f.seek(0, os.SEEK_END)
+            tail = b''
+            while pos > data_start:
+                step = min(4096, pos - data_start)
+                pos -= step
+                f.seek(pos)
+                tail = f.read(step) + tail
+                if b'\n' in tail.rstrip(b'\r\n'):
+                    break
+        
+        last_line = tail.rstrip(b'\r\n').rsplit(b'\n', 1)[-1]
+        if not last_line.strip():
+            return 0
+        try:
+            row = next(csv.reader([last_line.decode('utf-8')]))
+            if len(row) == len(header):
+                return int(row[loc_idx]) + 1
+        except (ValueError, csv.Error):
+            pass
+        return self._last_location_full_scan(csv_file)
+    
+    def _last_location_full_scan(self, csv_file: str) -> int:
+        """
+        Find the next free Location of an existing CHIRP CSV by parsing every row
+        
+        Returns:
+            Last row's Location + 1, or 0 if the file has no data rows
+        """
+        with open(csv_file, 'r', encoding='utf-8', newline='') as f:
+            last_row = deque(csv.DictReader(f), maxlen=1)
+        if not last_row:
+            return 0
+        return int(last_row[0].get('Location') or '-1') + 1
+    
     def to_chirp_csv(self, frequencies: List[Dict], output_file: str, append: bool = False):
         """
         Write frequencies to CHIRP-compatible CSV file
@@ -3944,36 +4688,43 @@ class RadioRefToChirp:
             print_status("No frequencies to export.", "warning")
             return
         
-        file_exists = os.path.exists(output_file) and append
+        file_exists = append and os.path.exists(output_file)
         mode = 'a' if append else 'w'
         
         start_location = 0
         if file_exists:
             try:
-                with open(output_file, 'r', encoding='utf-8') as f:
-                    reader = csv.DictReader(f)
-                    existing = list(reader)
-                    if existing:
-                        last_loc = int(existing[-1].get('Location', '-1'))
-                        start_location = last_loc + 1
-            except:
+                start_location = self._last_location(output_file)
+            except (OSError, ValueError, csv.Error):
                 start_location = 0
         
-        with open(output_file, mode, newline='', encoding='utf-8') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=self.CHIRP_COLUMNS)
+        columns = tuple(self.CHIRP_COLUMNS)
+        
+        def row_values(freq):
+            if type(freq) is Freq:
+                return _freq_values(freq)
+            return [freq.get(col, '') for col in columns]
+        
+        def appended_rows():
+            # Appended rows always continue the existing file's numbering
+            for location, freq in enumerate(frequencies, start_location):
+                freq['Location'] = str(location)
+                yield row_values(freq)
+        
+        def fresh_rows():
+            # A fresh file keeps any Location already set and fills the blanks
+            for location, freq in enumerate(frequencies, start_location):
+                if not freq.get('Location'):
+                    freq['Location'] = str(location)
+                yield row_values(freq)
+        
+        with open(output_file, mode, newline='', encoding='utf-8', buffering=1 << 20) as csvfile:
+            writer = csv.writer(csvfile, dialect='excel', quoting=csv.QUOTE_MINIMAL)
             
             if not file_exists:
-                writer.writeheader()
+                csvfile.write(self.CHIRP_HEADER_LINE)
             
-            for idx, freq in enumerate(frequencies):
-                if not freq.get('Location'):
-                    freq['Location'] = str(start_location + idx)
-                else:
-                    if file_exists:
-                        freq['Location'] = str(start_location + idx)
-                
-                row = {col: freq.get(col, '') for col in self.CHIRP_COLUMNS}
-                writer.writerow(row)
+            writer.writerows(appended_rows() if file_exists else fresh_rows())
         
         action = "Appended" if append else "Exported"
         print_status(f"{action} {len(frequencies)} frequencies to {output_file}", "success")
@@ -3994,48 +4745,53 @@ class RadioRefToChirp:
         mode = 'a' if append else 'w'
         file_exists = os.path.exists(output_file) and append
         
-        with open(output_file, mode, encoding='utf-8') as txtfile:
-            if file_exists:
-                txtfile.write("\n" + "="*80 + "\n")
-                txtfile.write("Additional Frequencies\n")
-                txtfile.write("="*80 + "\n\n")
+        parts = []
+        append_part = parts.append
+        if file_exists:
+            append_part("\n" + "="*80 + "\nAdditional Frequencies\n" + "="*80 + "\n\n")
+        
+        for idx, freq in enumerate(frequencies):
+            append_part(
+                f"Frequency #{idx + 1}\n"
+                f"{'-' * 40}\n"
+                f"Name:        {freq.get('Name', 'N/A')}\n"
+                f"Frequency:   {freq.get('Frequency', 'N/A')} MHz\n"
+                f"Mode:        {freq.get('Mode', 'FM')}\n"
+            )
             
-            for idx, freq in enumerate(frequencies):
-                txtfile.write(f"Frequency #{idx + 1}\n")
-                txtfile.write("-" * 40 + "\n")
-                txtfile.write(f"Name:        {freq.get('Name', 'N/A')}\n")
-                txtfile.write(f"Frequency:   {freq.get('Frequency', 'N/A')} MHz\n")
-                
-                mode_str = freq.get('Mode', 'FM')
-                txtfile.write(f"Mode:        {mode_str}\n")
-                
-                if freq.get('Duplex'):
-                    txtfile.write(f"Duplex:      {freq.get('Duplex', '')}\n")
-                if freq.get('Offset'):
-                    txtfile.write(f"Offset:      {freq.get('Offset', '')} MHz\n")
-                
-                tone_type = freq.get('Tone', 'No Tone')
-                if tone_type != 'No Tone':
-                    r_tone = freq.get('rToneFreq', '')
-                    c_tone = freq.get('cToneFreq', '')
-                    if r_tone or c_tone:
-                        txtfile.write(f"Tone:        {tone_type} ({r_tone if r_tone else c_tone} Hz)\n")
-                    else:
-                        txtfile.write(f"Tone:        {tone_type}\n")
+            duplex = freq.get('Duplex')
+            if duplex:
+                append_part(f"Duplex:      {duplex}\n")
+            offset = freq.get('Offset')
+            if offset:
+                append_part(f"Offset:      {offset} MHz\n")
+            
+            tone_type = freq.get('Tone', _NO_TONE)
+            if tone_type != _NO_TONE:
+                r_tone = freq.get('rToneFreq', '')
+                c_tone = freq.get('cToneFreq', '')
+                if r_tone or c_tone:
+                    append_part(f"Tone:        {tone_type} ({r_tone if r_tone else c_tone} Hz)\n")
                 else:
-                    txtfile.write(f"Tone:        No Tone\n")
-                
-                if freq.get('Comment'):
-                    txtfile.write(f"Description: {freq.get('Comment', '')}\n")
-                
-                txtfile.write("\n")
+                    append_part(f"Tone:        {tone_type}\n")
+            else:
+                append_part("Tone:        No Tone\n")
+            
+            comment = freq.get('Comment')
+            if comment:
+                append_part(f"Description: {comment}\n")
+            
+            append_part("\n")
+        
+        with open(output_file, mode, encoding='utf-8') as txtfile:
+            txtfile.write(''.join(parts))
         
         action = "Appended" if append else "Exported"
         print_status(f"{action} {len(frequencies)} frequencies to {output_file}", "success")
 
 
 def run_cli_mode(args):
-    converter = RadioRefToChirp()
+    converter = RadioRefToChirp(use_page_cache=not args.no_cache)
     frequencies = []
     
     if args.gmrs_frs:
@@ -4090,706 +4846,554 @@ def run_cli_mode(args):
         sys.exit(1)
 
 
+# Menu choices that scrape or export and therefore need a RadioRefToChirp instance
+_CONVERTER_CHOICES = frozenset([
+    '1', 'zip', 'zipcode', '2', 'city', '3', 'county',
+    '10', 'filter', '11', 'convert', 'csv2txt',
+    '13', 'cache', 'buildcache', '14', 'gmrs', 'frs',
+    '15', 'weather', 'wx', 'noaa',
+])
+
+
 def run_interactive_mode():
     clear_screen()
     print_banner()
     
     print(f"{Colors.WARNING}⚠  Use responsibly and comply with Radio Reference Terms of Service{Colors.RESET}\n")
     
-    converter = RadioRefToChirp()
+    # Built on first use so menu-only navigation never opens an HTTP session
+    converter = None
+    # The loop owns the redraw; a handler sets this False to keep its last message on screen
+    redraw = False
     
-    while True:
-        print_menu()
-        choice = get_user_input("Select an option: ", Colors.HEADER).strip().lower()
+    def handle_exit():
+        print(f"\n{Colors.SUCCESS}Thanks for using RadioRef Export!{Colors.RESET}\n")
+        sys.exit(0)
+    
+    def handle_zip_search():
+        nonlocal redraw
+        print(f"\n{Colors.HEADER}{'='*60}{Colors.RESET}")
+        print(f"{Colors.HEADER}  ZIP CODE SEARCH{Colors.RESET}")
+        print(f"{Colors.HEADER}{'='*60}{Colors.RESET}\n")
         
-        if choice in ['0', 'q', 'quit', 'exit']:
-            print(f"\n{Colors.SUCCESS}Thanks for using RadioRef Export!{Colors.RESET}\n")
-            sys.exit(0)
+        zipcode = get_user_input("Enter ZIP code: ", Colors.INFO)
+        if not zipcode:
+            print_status("ZIP code cannot be empty.", "error")
+            redraw = False
+            return
         
-        if choice in ['1', 'zip', 'zipcode']:
-            print(f"\n{Colors.HEADER}{'='*60}{Colors.RESET}")
-            print(f"{Colors.HEADER}  ZIP CODE SEARCH{Colors.RESET}")
-            print(f"{Colors.HEADER}{'='*60}{Colors.RESET}\n")
-            
-            zipcode = get_user_input("Enter ZIP code: ", Colors.INFO)
-            if not zipcode:
-                print_status("ZIP code cannot be empty.", "error")
-                continue
-            
-            output_file = get_user_input("Output filename (default: frequencies.csv): ", Colors.INFO)
-            if not output_file:
-                output_file = "frequencies.csv"
-            
-            format_choice = get_user_input("Format? (csv/txt, or press Enter for auto-detect): ", Colors.INFO)
-            if not format_choice:
-                if output_file.lower().endswith('.txt'):
-                    format_choice = 'txt'
-                else:
-                    format_choice = 'csv'
-            
-            append_choice = get_user_input("Append to existing file? (y/n, default: n): ", Colors.INFO)
-            append_mode = append_choice.lower() in ['y', 'yes']
-            
-            filter_mode = get_user_input("Filter by mode? (FM/Digital/DMR/P25, or press Enter for all): ", Colors.INFO)
-            if not filter_mode:
-                filter_mode = None
-            
-            frequencies = converter.lookup_by_zipcode(zipcode)
-            
-            if frequencies and filter_mode:
-                original_count = len(frequencies)
-                frequencies = converter.filter_frequencies(frequencies, filter_mode)
-                print_status(f"Filtered to {len(frequencies)} frequencies (from {original_count}) using mode: {filter_mode}", "info")
-            
-            if frequencies:
-                if format_choice.lower() == 'txt':
-                    converter.to_txt(frequencies, output_file, append=append_mode)
-                else:
-                    converter.to_chirp_csv(frequencies, output_file, append=append_mode)
-                print(f"\n{Colors.SUCCESS}✓ Export complete!{Colors.RESET}\n")
+        output_file = get_user_input("Output filename (default: frequencies.csv): ", Colors.INFO)
+        if not output_file:
+            output_file = "frequencies.csv"
+        
+        format_choice = get_user_input("Format? (csv/txt, or press Enter for auto-detect): ", Colors.INFO)
+        if not format_choice:
+            if output_file.lower().endswith('.txt'):
+                format_choice = 'txt'
             else:
-                print_status("No frequencies found. Please check your ZIP code.", "error")
-            
-            input(f"\n{Colors.INFO}Press Enter to continue...{Colors.RESET}")
-            clear_screen()
-            print_banner()
-            
-        elif choice in ['2', 'city']:
-            print(f"\n{Colors.HEADER}{'='*60}{Colors.RESET}")
-            print(f"{Colors.HEADER}  CITY & STATE SEARCH{Colors.RESET}")
-            print(f"{Colors.HEADER}{'='*60}{Colors.RESET}\n")
-            
-            city = get_user_input("Enter city name: ", Colors.INFO)
-            if not city:
-                print_status("City name cannot be empty.", "error")
-                continue
-            
-            state = get_user_input("Enter state abbreviation (e.g., CA, NY): ", Colors.INFO)
-            if not state:
-                print_status("State abbreviation cannot be empty.", "error")
-                continue
-            
-            output_file = get_user_input("Output filename (default: frequencies.csv): ", Colors.INFO)
-            if not output_file:
-                output_file = "frequencies.csv"
-            
-            format_choice = get_user_input("Format? (csv/txt, or press Enter for auto-detect): ", Colors.INFO)
-            if not format_choice:
-                if output_file.lower().endswith('.txt'):
-                    format_choice = 'txt'
-                else:
-                    format_choice = 'csv'
-            
-            append_choice = get_user_input("Append to existing file? (y/n, default: n): ", Colors.INFO)
-            append_mode = append_choice.lower() in ['y', 'yes']
-            
-            filter_mode = get_user_input("Filter by mode? (FM/Digital/DMR/P25, or press Enter for all): ", Colors.INFO)
-            if not filter_mode:
-                filter_mode = None
-            
-            frequencies = converter.lookup_by_city_state(city, state)
-            
-            if frequencies and filter_mode:
-                original_count = len(frequencies)
-                frequencies = converter.filter_frequencies(frequencies, filter_mode)
-                print_status(f"Filtered to {len(frequencies)} frequencies (from {original_count}) using mode: {filter_mode}", "info")
-            
-            if frequencies:
-                if format_choice.lower() == 'txt':
-                    converter.to_txt(frequencies, output_file, append=append_mode)
-                else:
-                    converter.to_chirp_csv(frequencies, output_file, append=append_mode)
-                print(f"\n{Colors.SUCCESS}✓ Export complete!{Colors.RESET}\n")
+                format_choice = 'csv'
+        
+        append_choice = get_user_input("Append to existing file? (y/n, default: n): ", Colors.INFO)
+        append_mode = append_choice.lower() in ['y', 'yes']
+        
+        filter_mode = get_user_input("Filter by mode? (FM/Digital/DMR/P25, or press Enter for all): ", Colors.INFO)
+        if not filter_mode:
+            filter_mode = None
+        
+        frequencies = converter.lookup_by_zipcode(zipcode)
+        
+        if frequencies and filter_mode:
+            original_count = len(frequencies)
+            frequencies = converter.filter_frequencies(frequencies, filter_mode)
+            print_status(f"Filtered to {len(frequencies)} frequencies (from {original_count}) using mode: {filter_mode}", "info")
+        
+        if frequencies:
+            if format_choice.lower() == 'txt':
+                converter.to_txt(frequencies, output_file, append=append_mode)
             else:
-                print_status("No frequencies found. Please check your city and state.", "error")
-            
-            input(f"\n{Colors.INFO}Press Enter to continue...{Colors.RESET}")
-            clear_screen()
-            print_banner()
-            
-        elif choice in ['3', 'county']:
-            print(f"\n{Colors.HEADER}{'='*60}{Colors.RESET}")
-            print(f"{Colors.HEADER}  COUNTY & STATE SEARCH{Colors.RESET}")
-            print(f"{Colors.HEADER}{'='*60}{Colors.RESET}\n")
-            
-            county = get_user_input("Enter county name: ", Colors.INFO)
-            if not county:
-                print_status("County name cannot be empty.", "error")
-                continue
-            
-            state = get_user_input("Enter state abbreviation (e.g., CA, NY): ", Colors.INFO)
-            if not state:
-                print_status("State abbreviation cannot be empty.", "error")
-                continue
-            
-            output_file = get_user_input("Output filename (default: frequencies.csv): ", Colors.INFO)
-            if not output_file:
-                output_file = "frequencies.csv"
-            
-            format_choice = get_user_input("Format? (csv/txt, or press Enter for auto-detect): ", Colors.INFO)
-            if not format_choice:
-                if output_file.lower().endswith('.txt'):
-                    format_choice = 'txt'
-                else:
-                    format_choice = 'csv'
-            
-            append_choice = get_user_input("Append to existing file? (y/n, default: n): ", Colors.INFO)
-            append_mode = append_choice.lower() in ['y', 'yes']
-            
-            filter_mode = get_user_input("Filter by mode? (FM/Digital/DMR/P25, or press Enter for all): ", Colors.INFO)
-            if not filter_mode:
-                filter_mode = None
-            
-            frequencies = converter.lookup_by_county_state(county, state)
-            
-            if frequencies and filter_mode:
-                original_count = len(frequencies)
-                frequencies = converter.filter_frequencies(frequencies, filter_mode)
-                print_status(f"Filtered to {len(frequencies)} frequencies (from {original_count}) using mode: {filter_mode}", "info")
-            
-            if frequencies:
-                if format_choice.lower() == 'txt':
-                    converter.to_txt(frequencies, output_file, append=append_mode)
-                else:
-                    converter.to_chirp_csv(frequencies, output_file, append=append_mode)
-                print(f"\n{Colors.SUCCESS}✓ Export complete!{Colors.RESET}\n")
+                converter.to_chirp_csv(frequencies, output_file, append=append_mode)
+            print(f"\n{Colors.SUCCESS}✓ Export complete!{Colors.RESET}\n")
+        else:
+            print_status("No frequencies found. Please check your ZIP code.", "error")
+        
+        input(f"\n{Colors.INFO}Press Enter to continue...{Colors.RESET}")
+    
+    def handle_city_search():
+        nonlocal redraw
+        print(f"\n{Colors.HEADER}{'='*60}{Colors.RESET}")
+        print(f"{Colors.HEADER}  CITY & STATE SEARCH{Colors.RESET}")
+        print(f"{Colors.HEADER}{'='*60}{Colors.RESET}\n")
+        
+        city = get_user_input("Enter city name: ", Colors.INFO)
+        if not city:
+            print_status("City name cannot be empty.", "error")
+            redraw = False
+            return
+        
+        state = get_user_input("Enter state abbreviation (e.g., CA, NY): ", Colors.INFO)
+        if not state:
+            print_status("State abbreviation cannot be empty.", "error")
+            redraw = False
+            return
+        
+        output_file = get_user_input("Output filename (default: frequencies.csv): ", Colors.INFO)
+        if not output_file:
+            output_file = "frequencies.csv"
+        
+        format_choice = get_user_input("Format? (csv/txt, or press Enter for auto-detect): ", Colors.INFO)
+        if not format_choice:
+            if output_file.lower().endswith('.txt'):
+                format_choice = 'txt'
             else:
-                print_status("No frequencies found. Please check your county and state.", "error")
-            
-            input(f"\n{Colors.INFO}Press Enter to continue...{Colors.RESET}")
-            clear_screen()
-            print_banner()
-            
-        elif choice in ['4', 'import', 'upload']:
-            run_import_menu()
-            clear_screen()
-            print_banner()
+                format_choice = 'csv'
         
-        elif choice in ['5', 'backup', 'save']:
-            clear_screen()
-            print_banner()
-            print(f"\n{Colors.HEADER}{'='*60}{Colors.RESET}")
-            print(f"{Colors.HEADER}  CREATE BACKUP{Colors.RESET}")
-            print(f"{Colors.HEADER}{'='*60}{Colors.RESET}\n")
-            
-            csv_file = get_user_input("Enter path to CHIRP CSV file: ", Colors.INFO)
-            if not csv_file:
-                print_status("No file specified.", "error")
-                input(f"\n{Colors.INFO}Press Enter to return to menu...{Colors.RESET}")
-                clear_screen()
-                print_banner()
-                continue
-            
-            if not os.path.exists(csv_file):
-                print_status(f"File not found: {csv_file}", "error")
-                input(f"\n{Colors.INFO}Press Enter to return to menu...{Colors.RESET}")
-                clear_screen()
-                print_banner()
-                continue
-            
-            is_valid, message, frequencies = validate_chirp_csv(csv_file)
-            if not is_valid:
-                print_status(f"CSV validation failed: {message}", "error")
-                input(f"\n{Colors.INFO}Press Enter to return to menu...{Colors.RESET}")
-                clear_screen()
-                print_banner()
-                continue
-            
-            print_status(f"Loaded {len(frequencies)} frequencies from CSV.", "success")
-            
-            selected_radio = get_selected_radio_model()
-            if selected_radio:
-                radio_model = selected_radio['name']
-                print(f"\n{Colors.INFO}Using selected radio model: {Colors.SUCCESS}{radio_model}{Colors.RESET}")
-                use_selected = get_user_input("Use this radio model? (y/n, default: y): ", Colors.INFO)
-                if use_selected.lower() in ['n', 'no']:
-                    radio_model = get_user_input("Enter radio model name: ", Colors.INFO)
-                    if not radio_model:
-                        print_status("Radio model is required.", "error")
-                        input(f"\n{Colors.INFO}Press Enter to return to menu...{Colors.RESET}")
-                        clear_screen()
-                        print_banner()
-                        continue
+        append_choice = get_user_input("Append to existing file? (y/n, default: n): ", Colors.INFO)
+        append_mode = append_choice.lower() in ['y', 'yes']
+        
+        filter_mode = get_user_input("Filter by mode? (FM/Digital/DMR/P25, or press Enter for all): ", Colors.INFO)
+        if not filter_mode:
+            filter_mode = None
+        
+        frequencies = converter.lookup_by_city_state(city, state)
+        
+        if frequencies and filter_mode:
+            original_count = len(frequencies)
+            frequencies = converter.filter_frequencies(frequencies, filter_mode)
+            print_status(f"Filtered to {len(frequencies)} frequencies (from {original_count}) using mode: {filter_mode}", "info")
+        
+        if frequencies:
+            if format_choice.lower() == 'txt':
+                converter.to_txt(frequencies, output_file, append=append_mode)
+            else:
+                converter.to_chirp_csv(frequencies, output_file, append=append_mode)
+            print(f"\n{Colors.SUCCESS}✓ Export complete!{Colors.RESET}\n")
+        else:
+            print_status("No frequencies found. Please check your city and state.", "error")
+        
+        input(f"\n{Colors.INFO}Press Enter to continue...{Colors.RESET}")
+    
+    def handle_county_search():
+        nonlocal redraw
+        print(f"\n{Colors.HEADER}{'='*60}{Colors.RESET}")
+        print(f"{Colors.HEADER}  COUNTY & STATE SEARCH{Colors.RESET}")
+        print(f"{Colors.HEADER}{'='*60}{Colors.RESET}\n")
+        
+        county = get_user_input("Enter county name: ", Colors.INFO)
+        if not county:
+            print_status("County name cannot be empty.", "error")
+            redraw = False
+            return
+        
+        state = get_user_input("Enter state abbreviation (e.g., CA, NY): ", Colors.INFO)
+        if not state:
+            print_status("State abbreviation cannot be empty.", "error")
+            redraw = False
+            return
+        
+        output_file = get_user_input("Output filename (default: frequencies.csv): ", Colors.INFO)
+        if not output_file:
+            output_file = "frequencies.csv"
+        
+        format_choice = get_user_input("Format? (csv/txt, or press Enter for auto-detect): ", Colors.INFO)
+        if not format_choice:
+            if output_file.lower().endswith('.txt'):
+                format_choice = 'txt'
+            else:
+                format_choice = 'csv'
+        
+        append_choice = get_user_input("Append to existing file? (y/n, default: n): ", Colors.INFO)
+        append_mode = append_choice.lower() in ['y', 'yes']
+        
+        filter_mode = get_user_input("Filter by mode? (FM/Digital/DMR/P25, or press Enter for all): ", Colors.INFO)
+        if not filter_mode:
+            filter_mode = None
+        
+        frequencies = converter.lookup_by_county_state(county, state)
+        
+        if frequencies and filter_mode:
+            original_count = len(frequencies)
+            frequencies = converter.filter_frequencies(frequencies, filter_mode)
+            print_status(f"Filtered to {len(frequencies)} frequencies (from {original_count}) using mode: {filter_mode}", "info")
+        
+        if frequencies:
+            if format_choice.lower() == 'txt':
+                converter.to_txt(frequencies, output_file, append=append_mode)
             else:
+                converter.to_chirp_csv(frequencies, output_file, append=append_mode)
+            print(f"\n{Colors.SUCCESS}✓ Export complete!{Colors.RESET}\n")
+        else:
+            print_status("No frequencies found. Please check your county and state.", "error")
+        
+        input(f"\n{Colors.INFO}Press Enter to continue...{Colors.RESET}")
+    
+    def handle_import():
+        run_import_menu()
+    
+    def handle_backup():
+        clear_screen()
+        print_banner()
+        print(f"\n{Colors.HEADER}{'='*60}{Colors.RESET}")
+        print(f"{Colors.HEADER}  CREATE BACKUP{Colors.RESET}")
+        print(f"{Colors.HEADER}{'='*60}{Colors.RESET}\n")
+        
+        csv_file = get_user_input("Enter path to CHIRP CSV file: ", Colors.INFO)
+        if not csv_file:
+            print_status("No file specified.", "error")
+            input(f"\n{Colors.INFO}Press Enter to return to menu...{Colors.RESET}")
+            return
+        
+        if not os.path.exists(csv_file):
+            print_status(f"File not found: {csv_file}", "error")
+            input(f"\n{Colors.INFO}Press Enter to return to menu...{Colors.RESET}")
+            return
+        
+        is_valid, message, frequencies = validate_chirp_csv(csv_file)
+        if not is_valid:
+            print_status(f"CSV validation failed: {message}", "error")
+            input(f"\n{Colors.INFO}Press Enter to return to menu...{Colors.RESET}")
+            return
+        
+        print_status(f"Loaded {len(frequencies)} frequencies from CSV.", "success")
+        
+        selected_radio = get_selected_radio_model()
+        if selected_radio:
+            radio_model = selected_radio['name']
+            print(f"\n{Colors.INFO}Using selected radio model: {Colors.SUCCESS}{radio_model}{Colors.RESET}")
+            use_selected = get_user_input("Use this radio model? (y/n, default: y): ", Colors.INFO)
+            if use_selected.lower() in ['n', 'no']:
                 radio_model = get_user_input("Enter radio model name: ", Colors.INFO)
                 if not radio_model:
                     print_status("Radio model is required.", "error")
                     input(f"\n{Colors.INFO}Press Enter to return to menu...{Colors.RESET}")
-                    clear_screen()
-                    print_banner()
-                    continue
-            
-            ports = detect_serial_ports()
-            port = None
+                    return
+        else:
+            radio_model = get_user_input("Enter radio model name: ", Colors.INFO)
+            if not radio_model:
+                print_status("Radio model is required.", "error")
+                input(f"\n{Colors.INFO}Press Enter to return to menu...{Colors.RESET}")
+                return
+        
+        ports = detect_serial_ports()
+        port = None
+        
+        if ports:
+            print(f"\n{Colors.INFO}Available serial ports:{Colors.RESET}\n")
+            for idx, (port_name, description) in enumerate(ports, 1):
+                print(f"  {Colors.INFO}[{idx}]{Colors.RESET} {Colors.HEADER}{port_name}{Colors.RESET}")
+                print(f"      {Colors.DIM}{description}{Colors.RESET}\n")
             
-            if ports:
-                print(f"\n{Colors.INFO}Available serial ports:{Colors.RESET}\n")
-                for idx, (port_name, description) in enumerate(ports, 1):
-                    print(f"  {Colors.INFO}[{idx}]{Colors.RESET} {Colors.HEADER}{port_name}{Colors.RESET}")
-                    print(f"      {Colors.DIM}{description}{Colors.RESET}\n")
+            port_choice = get_user_input(f"Select port (1-{len(ports)}) or enter custom port: ", Colors.INFO)
+            if port_choice:
+                try:
+                    port_idx = int(port_choice) - 1
+                    if 0 <= port_idx < len(ports):
+                        port = ports[port_idx][0]
+                    else:
+                        port = port_choice
+                except ValueError:
+                    port = port_choice
+        else:
+            port = get_user_input("Enter serial port manually (e.g., COM3, /dev/ttyUSB0): ", Colors.INFO)
+        
+        if not port:
+            print_status("Serial port is required.", "error")
+            input(f"\n{Colors.INFO}Press Enter to return to menu...{Colors.RESET}")
+            return
+        
+        print_status("Creating backup...", "info")
+        backup_file = create_backup_file(radio_model, port, frequencies=frequencies, csv_file=csv_file)
+        
+        if backup_file:
+            print_status(f"Backup created successfully: {backup_file}", "success")
+            print(f"\n{Colors.INFO}Backup contains:{Colors.RESET}")
+            print(f"  - Radio Model: {radio_model}")
+            print(f"  - Serial Port: {port}")
+            print(f"  - Frequencies: {len(frequencies)}")
+            print(f"  - CSV File: {csv_file}")
+        else:
+            print_status("Failed to create backup.", "error")
+        
+        input(f"\n{Colors.INFO}Press Enter to return to menu...{Colors.RESET}")
+    
+    def handle_restore():
+        clear_screen()
+        print_banner()
+        print(f"\n{Colors.HEADER}{'='*60}{Colors.RESET}")
+        print(f"{Colors.HEADER}  RESTORE FROM BACKUP{Colors.RESET}")
+        print(f"{Colors.HEADER}{'='*60}{Colors.RESET}\n")
+        
+        backup_dir = "backups"
+        if not os.path.exists(backup_dir):
+            print_status("No backups directory found.", "error")
+            print(f"{Colors.INFO}Backups will be saved to: {backup_dir}{Colors.RESET}")
+            input(f"\n{Colors.INFO}Press Enter to return to menu...{Colors.RESET}")
+        else:
+            with os.scandir(backup_dir) as dir_entries:
+                backup_files = [e for e in dir_entries if e.name.endswith('.backup')]
+            if backup_files:
+                backup_files.sort(key=lambda e: e.stat().st_mtime, reverse=True)
+                print(f"{Colors.SUCCESS}Found {len(backup_files)} backup file(s):{Colors.RESET}\n")
+                
+                backup_list = [e.path for e in backup_files[:20]]
+                with ThreadPoolExecutor(max_workers=8) as executor:
+                    backup_metas = list(executor.map(_read_backup_meta, backup_list))
                 
-                port_choice = get_user_input(f"Select port (1-{len(ports)}) or enter custom port: ", Colors.INFO)
-                if port_choice:
+                listing = []
+                for idx, (backup_entry, meta) in enumerate(zip(backup_files, backup_metas), 1):
+                    backup_file = backup_entry.name
+                    if meta is None:
+                        listing.append(_BACKUP_ERROR_TMPL % (idx, backup_file))
+                        continue
+                    
+                    restore_indicator = _BACKUP_RESTORE_TAG if meta['has_data'] else _BACKUP_NO_DATA_TAG
+                    listing.append(_BACKUP_ROW_TMPL % (idx, backup_file, restore_indicator,
+                                                       meta['radio_model'], meta['serial_port'], meta['backup_date']))
+                    if meta['frequency_count']:
+                        listing.append(f"      Frequencies: {meta['frequency_count']}")
+                    listing.append("")
+                if listing:
+                    print("\n".join(listing))
+                
+                if len(backup_files) > 20:
+                    print(f"{Colors.DIM}... and {len(backup_files) - 20} more backup files{Colors.RESET}\n")
+                
+                restore_choice = get_user_input(f"\nSelect backup to restore (1-{min(len(backup_files), 20)}) or press Enter to cancel: ", Colors.INFO)
+                
+                if restore_choice:
                     try:
-                        port_idx = int(port_choice) - 1
-                        if 0 <= port_idx < len(ports):
-                            port = ports[port_idx][0]
+                        restore_idx = int(restore_choice) - 1
+                        if 0 <= restore_idx < len(backup_list):
+                            selected_backup = backup_list[restore_idx]
+                            restore_from_backup(selected_backup)
                         else:
-                            port = port_choice
+                            print_status("Invalid selection.", "error")
+                            time.sleep(1)
                     except ValueError:
-                        port = port_choice
+                        print_status("Invalid selection.", "error")
+                        time.sleep(1)
             else:
-                port = get_user_input("Enter serial port manually (e.g., COM3, /dev/ttyUSB0): ", Colors.INFO)
-            
-            if not port:
-                print_status("Serial port is required.", "error")
+                print_status("No backup files found.", "info")
                 input(f"\n{Colors.INFO}Press Enter to return to menu...{Colors.RESET}")
-                clear_screen()
-                print_banner()
-                continue
-            
-            print_status("Creating backup...", "info")
-            backup_file = create_backup_file(radio_model, port, frequencies=frequencies, csv_file=csv_file)
-            
-            if backup_file:
-                print_status(f"Backup created successfully: {backup_file}", "success")
-                print(f"\n{Colors.INFO}Backup contains:{Colors.RESET}")
-                print(f"  - Radio Model: {radio_model}")
-                print(f"  - Serial Port: {port}")
-                print(f"  - Frequencies: {len(frequencies)}")
-                print(f"  - CSV File: {csv_file}")
-            else:
-                print_status("Failed to create backup.", "error")
-            
-            input(f"\n{Colors.INFO}Press Enter to return to menu...{Colors.RESET}")
-            clear_screen()
-            print_banner()
+    
+    def handle_validate():
+        clear_screen()
+        print_banner()
+        print(f"\n{Colors.HEADER}{'='*60}{Colors.RESET}")
+        print(f"{Colors.HEADER}  VALIDATE CSV FILE{Colors.RESET}")
+        print(f"{Colors.HEADER}{'='*60}{Colors.RESET}\n")
         
-        elif choice in ['6', 'restore']:
-            clear_screen()
-            print_banner()
-            print(f"\n{Colors.HEADER}{'='*60}{Colors.RESET}")
-            print(f"{Colors.HEADER}  RESTORE FROM BACKUP{Colors.RESET}")
-            print(f"{Colors.HEADER}{'='*60}{Colors.RESET}\n")
+        csv_file = get_user_input("Enter path to CSV file: ", Colors.INFO)
+        if csv_file:
+            print_status("Validating CSV file...", "info")
+            is_valid, message, frequencies = validate_chirp_csv(csv_file)
             
-            backup_dir = "backups"
-            if not os.path.exists(backup_dir):
-                print_status("No backups directory found.", "error")
-                print(f"{Colors.INFO}Backups will be saved to: {backup_dir}{Colors.RESET}")
-                input(f"\n{Colors.INFO}Press Enter to return to menu...{Colors.RESET}")
-                clear_screen()
-                print_banner()
+            if is_valid:
+                print_status(message, "success")
+                print(f"\n{Colors.INFO}File contains {len(frequencies)} frequencies.{Colors.RESET}")
             else:
-                backup_files = [f for f in os.listdir(backup_dir) if f.endswith('.backup')]
-                if backup_files:
-                    backup_files.sort(reverse=True)
-                    print(f"{Colors.SUCCESS}Found {len(backup_files)} backup file(s):{Colors.RESET}\n")
-                    
-                    backup_list = []
-                    for idx, backup_file in enumerate(backup_files[:20], 1):
-                        backup_path = os.path.join(backup_dir, backup_file)
-                        try:
-                            with open(backup_path, 'r') as f:
-                                backup_data = json.load(f)
-                                radio_model = backup_data.get('radio_model', 'Unknown')
-                                serial_port = backup_data.get('serial_port', 'Unknown')
-                                backup_date = backup_data.get('backup_date', 'Unknown')
-                                frequency_count = backup_data.get('frequency_count', 0)
-                                has_data = bool(backup_data.get('frequencies') or backup_data.get('csv_content'))
-                                
-                                backup_list.append(backup_path)
-                                
-                                restore_indicator = f"{Colors.SUCCESS}[RESTORE]{Colors.RESET}" if has_data else f"{Colors.DIM}[NO DATA]{Colors.RESET}"
-                                print(f"  {Colors.INFO}[{idx}]{Colors.RESET} {Colors.HEADER}{backup_file}{Colors.RESET} {restore_indicator}")
-                                print(f"      Radio: {radio_model}")
-                                print(f"      Port: {serial_port}")
-                                print(f"      Date: {backup_date}")
-                                if frequency_count:
-                                    print(f"      Frequencies: {frequency_count}")
-                                print()
-                        except Exception as e:
-                            print(f"  {Colors.INFO}[{idx}]{Colors.RESET} {backup_file} {Colors.DIM}(Error reading metadata){Colors.RESET}\n")
-                            backup_list.append(backup_path)
-                    
-                    if len(backup_files) > 20:
-                        print(f"{Colors.DIM}... and {len(backup_files) - 20} more backup files{Colors.RESET}\n")
-                    
-                    restore_choice = get_user_input(f"\nSelect backup to restore (1-{min(len(backup_files), 20)}) or press Enter to cancel: ", Colors.INFO)
-                    
-                    if restore_choice:
-                        try:
-                            restore_idx = int(restore_choice) - 1
-                            if 0 <= restore_idx < len(backup_list):
-                                selected_backup = backup_list[restore_idx]
-                                restore_from_backup(selected_backup)
-                            else:
-                                print_status("Invalid selection.", "error")
-                                time.sleep(1)
-                        except ValueError:
-                            print_status("Invalid selection.", "error")
-                            time.sleep(1)
-                else:
-                    print_status("No backup files found.", "info")
-                    input(f"\n{Colors.INFO}Press Enter to return to menu...{Colors.RESET}")
-            
-            clear_screen()
-            print_banner()
+                print_status(message, "error")
+        else:
+            print_status("No file specified.", "error")
         
-        elif choice in ['7', 'validate']:
-            clear_screen()
-            print_banner()
-            print(f"\n{Colors.HEADER}{'='*60}{Colors.RESET}")
-            print(f"{Colors.HEADER}  VALIDATE CSV FILE{Colors.RESET}")
-            print(f"{Colors.HEADER}{'='*60}{Colors.RESET}\n")
-            
-            csv_file = get_user_input("Enter path to CSV file: ", Colors.INFO)
-            if csv_file:
-                print_status("Validating CSV file...", "info")
-                is_valid, message, frequencies = validate_chirp_csv(csv_file)
-                
-                if is_valid:
-                    print_status(message, "success")
-                    print(f"\n{Colors.INFO}File contains {len(frequencies)} frequencies.{Colors.RESET}")
-                else:
-                    print_status(message, "error")
-            else:
-                print_status("No file specified.", "error")
-            
-            input(f"\n{Colors.INFO}Press Enter to return to menu...{Colors.RESET}")
-            clear_screen()
-            print_banner()
+        input(f"\n{Colors.INFO}Press Enter to return to menu...{Colors.RESET}")
+    
+    def handle_serial_ports():
+        clear_screen()
+        print_banner()
+        print(f"\n{Colors.HEADER}{'='*60}{Colors.RESET}")
+        print(f"{Colors.HEADER}  SERIAL PORTS{Colors.RESET}")
+        print(f"{Colors.HEADER}{'='*60}{Colors.RESET}\n")
         
-        elif choice in ['8', 'ports', 'serial']:
-            clear_screen()
-            print_banner()
-            print(f"\n{Colors.HEADER}{'='*60}{Colors.RESET}")
-            print(f"{Colors.HEADER}  SERIAL PORTS{Colors.RESET}")
-            print(f"{Colors.HEADER}{'='*60}{Colors.RESET}\n")
-            
+        force_rescan = False
+        while True:
             print_status("Detecting serial ports...", "info")
-            ports = detect_serial_ports()
+            ports = detect_serial_ports(force=force_rescan)
             
+            ftdi_ports = []
             if ports:
                 print(f"\n{Colors.SUCCESS}Found {len(ports)} serial port(s):{Colors.RESET}\n")
                 for idx, (port_name, description) in enumerate(ports, 1):
                     print(f"  {Colors.INFO}[{idx}]{Colors.RESET} {Colors.HEADER}{port_name}{Colors.RESET}")
                     print(f"      {Colors.DIM}{description}{Colors.RESET}\n")
+                    timer_path = get_ftdi_latency_timer_path(port_name, description)
+                    if timer_path:
+                        ftdi_ports.append((port_name, timer_path))
             else:
                 print_status("No serial ports detected.", "warning")
                 print(f"{Colors.INFO}Make sure your radio is connected via USB.{Colors.RESET}")
             
-            input(f"\n{Colors.INFO}Press Enter to return to menu...{Colors.RESET}")
-            clear_screen()
-            print_banner()
-        
-        elif choice in ['13', 'cache', 'buildcache']:
-            clear_screen()
-            print_banner()
-            print(f"\n{Colors.HEADER}{'='*60}{Colors.RESET}")
-            print(f"{Colors.HEADER}  BUILD COUNTY CACHE{Colors.RESET}")
-            print(f"{Colors.HEADER}{'='*60}{Colors.RESET}\n")
-            
-            print(f"{Colors.INFO}This will build a cache of county IDs for faster lookups.{Colors.RESET}")
-            print(f"{Colors.DIM}The cache is stored in countyID.db (JSON format){Colors.RESET}\n")
-            
-            converter = RadioRefToChirp()
-            cache = converter._load_county_cache()
-            if cache:
-                total_counties = len(cache)
-                states_with_cache = len(set(k[1] for k in cache.keys()))
-                print(f"{Colors.SUCCESS}Current cache:{Colors.RESET} {total_counties} counties from {states_with_cache} states\n")
+            if ftdi_ports:
+                print(f"{Colors.INFO}FTDI adapter detected. Setting low latency speeds up CHIRP transfers.{Colors.RESET}")
+                rescan = input(f"\n{Colors.INFO}Press Enter to return to menu, R to rescan, or L to set low latency...{Colors.RESET}")
             else:
-                print(f"{Colors.WARNING}No counties cached yet.{Colors.RESET}\n")
+                rescan = input(f"\n{Colors.INFO}Press Enter to return to menu, or R to rescan...{Colors.RESET}")
             
-            print(f"{Colors.INFO}[1]{Colors.RESET} Build cache for a specific state")
-            print(f"{Colors.INFO}[2]{Colors.RESET} Build cache for all states {Colors.DIM}(may take a while){Colors.RESET}")
-            print(f"{Colors.INFO}[3]{Colors.RESET} View cache statistics")
-            print(f"{Colors.INFO}[0]{Colors.RESET} Cancel\n")
-            
-            cache_choice = get_user_input("Select option: ", Colors.INFO)
-            
-            if cache_choice == '1':
-                state_input = get_user_input("Enter state abbreviation (e.g., CA): ", Colors.INFO).upper().strip()
-                if state_input and len(state_input) == 2:
-                    print()
-                    count = converter.build_county_cache_for_state(state_input)
-                    print_status(f"Cache building complete for {state_input}. Total counties: {count}", "success")
-                else:
-                    print_status("Invalid state abbreviation", "error")
-            
-            elif cache_choice == '2':
-                confirm = get_user_input("This will test many county IDs and may take 10-30 minutes. Continue? (yes/no): ", Colors.WARNING)
-                if confirm.lower() in ['yes', 'y']:
-                    print()
-                    results = converter.build_county_cache_for_all_states()
-                    print(f"\n{Colors.HEADER}{'='*60}{Colors.RESET}")
-                    print(f"{Colors.HEADER}  CACHE BUILDING COMPLETE{Colors.RESET}")
-                    print(f"{Colors.HEADER}{'='*60}{Colors.RESET}\n")
-                    print(f"{Colors.SUCCESS}Summary:{Colors.RESET}\n")
-                    for state, count in sorted(results.items()):
-                        print(f"  {state}: {count} counties")
-                    total = sum(results.values())
-                    print(f"\n{Colors.SUCCESS}Total: {total} counties cached{Colors.RESET}")
-                else:
-                    print_status("Cancelled", "info")
-            
-            elif cache_choice == '3':
-                cache = converter._load_county_cache()
-                if cache:
-                    print(f"\n{Colors.HEADER}Cache Statistics:{Colors.RESET}\n")
-                    states = {}
-                    for (county, state), ctid in cache.items():
-                        if state not in states:
-                            states[state] = []
-                        states[state].append((county, ctid))
-                    
-                    print(f"{Colors.INFO}Total counties cached:{Colors.RESET} {len(cache)}")
-                    print(f"{Colors.INFO}States covered:{Colors.RESET} {len(states)}\n")
-                    print(f"{Colors.HEADER}Counties by state:{Colors.RESET}\n")
-                    for state in sorted(states.keys()):
-                        print(f"  {state.upper()}: {len(states[state])} counties")
-                        for county, ctid in states[state][:5]:
-                            print(f"    - {county.title()}: {ctid}")
-                        if len(states[state]) > 5:
-                            print(f"    ... and {len(states[state]) - 5} more")
-                        print()
-                else:
-                    print_status("No counties cached yet", "warning")
-            
-            input(f"\n{Colors.INFO}Press Enter to return to menu...{Colors.RESET}")
-            clear_screen()
-            print_banner()
+            if ftdi_ports and rescan.strip().lower() == 'l':
+                for port_name, timer_path in ftdi_ports:
+                    success, message = set_serial_low_latency(port_name, timer_path)
+                    print_status(message, "success" if success else "info")
+                input(f"\n{Colors.INFO}Press Enter to return to menu...{Colors.RESET}")
+                break
+            if rescan.strip().lower() != 'r':
+                break
+            force_rescan = True
+            print()
+    
+    def handle_build_county_cache():
+        clear_screen()
+        print_banner()
+        print(f"\n{Colors.HEADER}{'='*60}{Colors.RESET}")
+        print(f"{Colors.HEADER}  BUILD COUNTY CACHE{Colors.RESET}")
+        print(f"{Colors.HEADER}{'='*60}{Colors.RESET}\n")
         
-        elif choice in ['9', 'models', 'radios', 'select']:
-            clear_screen()
-            print_banner()
-            print(f"\n{Colors.HEADER}{'='*60}{Colors.RESET}")
-            print(f"{Colors.HEADER}  SELECT RADIO MODEL{Colors.RESET}")
-            print(f"{Colors.HEADER}{'='*60}{Colors.RESET}\n")
-            
-            selected = get_selected_radio_model()
-            if selected:
-                print(f"{Colors.SUCCESS}Currently Selected:{Colors.RESET} {selected['name']} ({selected['manufacturer']})")
-                print(f"{Colors.INFO}Baudrate:{Colors.RESET} {selected['baudrate']} | {Colors.INFO}Max Channels:{Colors.RESET} {selected['max_channels']}\n")
-            
-            models = get_radio_models()
-            print(f"{Colors.INFO}CHIRP-Compatible Radio Models:{Colors.RESET}\n")
-            
-            for idx, model in enumerate(models, 1):
-                marker = f"{Colors.SUCCESS}✓{Colors.RESET} " if selected and selected['name'] == model['name'] else "  "
-                print(f"{marker}{Colors.INFO}[{idx}]{Colors.RESET} {Colors.HEADER}{model['name']}{Colors.RESET}")
-                print(f"      Manufacturer: {model['manufacturer']}")
-                print(f"      Max Channels: {model['max_channels']} | Baudrate: {model['baudrate']}")
-                print(f"      CHIRP ID: {model['chirp_id']}")
-                if model.get('notes'):
-                    print(f"      {Colors.DIM}Note: {model['notes']}{Colors.RESET}")
+        print(f"{Colors.INFO}This will build a cache of county IDs for faster lookups.{Colors.RESET}")
+        print(f"{Colors.DIM}The cache is stored in countyID.db (JSON format){Colors.RESET}\n")
+        
+        cache = converter._load_county_cache()
+        cache_by_state = converter._get_county_cache_by_state()
+        if cache:
+            total_counties = len(cache)
+            states_with_cache = len(cache_by_state)
+            print(f"{Colors.SUCCESS}Current cache:{Colors.RESET} {total_counties} counties from {states_with_cache} states\n")
+        else:
+            print(f"{Colors.WARNING}No counties cached yet.{Colors.RESET}\n")
+        
+        print(f"{Colors.INFO}[1]{Colors.RESET} Build cache for a specific state")
+        print(f"{Colors.INFO}[2]{Colors.RESET} Build cache for all states {Colors.DIM}(may take a while){Colors.RESET}")
+        print(f"{Colors.INFO}[3]{Colors.RESET} View cache statistics")
+        print(f"{Colors.INFO}[0]{Colors.RESET} Cancel\n")
+        
+        cache_choice = get_user_input("Select option: ", Colors.INFO)
+        
+        if cache_choice == '1':
+            state_input = get_user_input("Enter state abbreviation (e.g., CA): ", Colors.INFO).upper().strip()
+            if state_input and len(state_input) == 2:
                 print()
-            
-            print(f"{Colors.DIM}Note: These are common models. CHIRP supports many more.{Colors.RESET}\n")
-            
-            model_choice = get_user_input(f"Select model (1-{len(models)}) or press Enter to keep current: ", Colors.INFO)
-            
-            if model_choice:
-                try:
-                    model_idx = int(model_choice) - 1
-                    if 0 <= model_idx < len(models):
-                        selected_model = models[model_idx]
-                        if save_selected_radio_model(selected_model['name']):
-                            print_status(f"Radio model set to: {selected_model['name']}", "success")
-                            print(f"{Colors.INFO}Settings:{Colors.RESET}")
-                            print(f"  - Baudrate: {selected_model['baudrate']}")
-                            print(f"  - Max Channels: {selected_model['max_channels']}")
-                            print(f"  - CHIRP ID: {selected_model['chirp_id']}")
-                        else:
-                            print_status("Failed to save radio model selection.", "error")
-                    else:
-                        print_status("Invalid selection.", "error")
-                except ValueError:
-                    print_status("Invalid input. Please enter a number.", "error")
-            
-            input(f"\n{Colors.INFO}Press Enter to return to menu...{Colors.RESET}")
-            clear_screen()
-            print_banner()
+                count = converter.build_county_cache_for_state(state_input)
+                print_status(f"Cache building complete for {state_input}. Total counties: {count}", "success")
+            else:
+                print_status("Invalid state abbreviation", "error")
         
-        elif choice in ['10', 'filter']:
-            clear_screen()
-            print_banner()
-            print(f"\n{Colors.HEADER}{'='*60}{Colors.RESET}")
-            print(f"{Colors.HEADER}  FILTER EXISTING CSV FILE{Colors.RESET}")
-            print(f"{Colors.HEADER}{'='*60}{Colors.RESET}\n")
-            
-            csv_file = get_user_input("Enter path to CSV file: ", Colors.INFO)
-            if not csv_file:
-                print_status("No file specified.", "error")
-                input(f"\n{Colors.INFO}Press Enter to return to menu...{Colors.RESET}")
-                clear_screen()
-                print_banner()
-                continue
-            
-            is_valid, message, frequencies = validate_chirp_csv(csv_file)
-            if not is_valid:
-                print_status(f"CSV validation failed: {message}", "error")
-                input(f"\n{Colors.INFO}Press Enter to return to menu...{Colors.RESET}")
-                clear_screen()
-                print_banner()
-                continue
-            
-            print_status(f"Loaded {len(frequencies)} frequencies from CSV.", "success")
-            
-            filter_mode = get_user_input("Filter by mode? (FM/Digital/DMR/P25, or press Enter for all): ", Colors.INFO)
-            if filter_mode:
-                original_count = len(frequencies)
-                frequencies = converter.filter_frequencies(frequencies, filter_mode)
-                print_status(f"Filtered to {len(frequencies)} frequencies (from {original_count}) using mode: {filter_mode}", "info")
-            
-            if frequencies:
-                output_file = get_user_input("Output filename (default: filtered_frequencies.csv): ", Colors.INFO)
-                if not output_file:
-                    output_file = "filtered_frequencies.csv"
-                
-                format_choice = get_user_input("Format? (csv/txt, or press Enter for auto-detect): ", Colors.INFO)
-                if not format_choice:
-                    if output_file.lower().endswith('.txt'):
-                        format_choice = 'txt'
+        elif cache_choice == '2':
+            confirm = get_user_input("This will test many county IDs and may take 10-30 minutes. Continue? (yes/no): ", Colors.WARNING)
+            if confirm.lower() in ['yes', 'y']:
+                print()
+                results = converter.build_county_cache_for_all_states()
+                print(f"\n{Colors.HEADER}{'='*60}{Colors.RESET}")
+                print(f"{Colors.HEADER}  CACHE BUILDING COMPLETE{Colors.RESET}")
+                print(f"{Colors.HEADER}{'='*60}{Colors.RESET}\n")
+                print(f"{Colors.SUCCESS}Summary:{Colors.RESET}\n")
+                for state, count in sorted(results.items()):
+                    print(f"  {state}: {count} counties")
+                total = sum(results.values())
+                print(f"\n{Colors.SUCCESS}Total: {total} counties cached{Colors.RESET}")
+            else:
+                print_status("Cancelled", "info")
+        
+        elif cache_choice == '3':
+            if cache:
+                print(f"\n{Colors.HEADER}Cache Statistics:{Colors.RESET}\n")
+                print(f"{Colors.INFO}Total counties cached:{Colors.RESET} {len(cache)}")
+                print(f"{Colors.INFO}States covered:{Colors.RESET} {states_with_cache}\n")
+                print(f"{Colors.HEADER}Counties by state:{Colors.RESET}\n")
+                for state in sorted(cache_by_state):
+                    counties = cache_by_state[state]
+                    print(f"  {state.upper()}: {len(counties)} counties")
+                    for county, ctid in itertools.islice(counties.items(), 5):
+                        print(f"    - {county.title()}: {ctid}")
+                    if len(counties) > 5:
+                        print(f"    ... and {len(counties) - 5} more")
+                    print()
+            else:
+                print_status("No counties cached yet", "warning")
+        
+        input(f"\n{Colors.INFO}Press Enter to return to menu...{Colors.RESET}")
+    
+    def handle_select_radio_model():
+        clear_screen()
+        print_banner()
+        print(f"\n{Colors.HEADER}{'='*60}{Colors.RESET}")
+        print(f"{Colors.HEADER}  SELECT RADIO MODEL{Colors.RESET}")
+        print(f"{Colors.HEADER}{'='*60}{Colors.RESET}\n")
+        
+        selected = get_selected_radio_model()
+        if selected:
+            print(f"{Colors.SUCCESS}Currently Selected:{Colors.RESET} {selected['name']} ({selected['manufacturer']})")
+            print(f"{Colors.INFO}Baudrate:{Colors.RESET} {selected['baudrate']} | {Colors.INFO}Max Channels:{Colors.RESET} {selected['max_channels']}\n")
+        
+        models = get_radio_models()
+        print(f"{Colors.INFO}CHIRP-Compatible Radio Models:{Colors.RESET}\n")
+        
+        selected_name = selected['name'] if selected else None
+        selected_marker = f"{Colors.SUCCESS}✓{Colors.RESET} "
+        print(''.join(
+            (selected_marker if name == selected_name else "  ") + heading + details
+            for name, heading, details in _get_radio_model_lines()
+        ), end='')
+        
+        print(f"{Colors.DIM}Note: These are common models. CHIRP supports many more.{Colors.RESET}\n")
+        
+        model_choice = get_user_input(f"Select model (1-{len(models)}) or press Enter to keep current: ", Colors.INFO)
+        
+        if model_choice:
+            try:
+                model_idx = int(model_choice) - 1
+                if 0 <= model_idx < len(models):
+                    selected_model = models[model_idx]
+                    if save_selected_radio_model(selected_model['name']):
+                        print_status(f"Radio model set to: {selected_model['name']}", "success")
+                        print(f"{Colors.INFO}Settings:{Colors.RESET}")
+                        print(f"  - Baudrate: {selected_model['baudrate']}")
+                        print(f"  - Max Channels: {selected_model['max_channels']}")
+                        print(f"  - CHIRP ID: {selected_model['chirp_id']}")
                     else:
-                        format_choice = 'csv'
-                
-                if format_choice.lower() == 'txt':
-                    converter.to_txt(frequencies, output_file, append=False)
+                        print_status("Failed to save radio model selection.", "error")
                 else:
-                    converter.to_chirp_csv(frequencies, output_file, append=False)
-                
-                print_status(f"Filtered frequencies saved to {output_file}", "success")
-            else:
-                print_status("No frequencies remaining after filter.", "warning")
-            
+                    print_status("Invalid selection.", "error")
+            except ValueError:
+                print_status("Invalid input. Please enter a number.", "error")
+        
+        input(f"\n{Colors.INFO}Press Enter to return to menu...{Colors.RESET}")
+    
+    def handle_filter_csv():
+        clear_screen()
+        print_banner()
+        print(f"\n{Colors.HEADER}{'='*60}{Colors.RESET}")
+        print(f"{Colors.HEADER}  FILTER EXISTING CSV FILE{Colors.RESET}")
+        print(f"{Colors.HEADER}{'='*60}{Colors.RESET}\n")
+        
+        csv_file = get_user_input("Enter path to CSV file: ", Colors.INFO)
+        if not csv_file:
+            print_status("No file specified.", "error")
             input(f"\n{Colors.INFO}Press Enter to return to menu...{Colors.RESET}")
-            clear_screen()
-            print_banner()
+            return
         
-        elif choice in ['11', 'convert', 'csv2txt']:
-            clear_screen()
-            print_banner()
-            print(f"\n{Colors.HEADER}{'='*60}{Colors.RESET}")
-            print(f"{Colors.HEADER}  CONVERT CSV TO TXT{Colors.RESET}")
-            print(f"{Colors.HEADER}{'='*60}{Colors.RESET}\n")
-            
-            csv_file = get_user_input("Enter path to CSV file: ", Colors.INFO)
-            if not csv_file:
-                print_status("No file specified.", "error")
-                input(f"\n{Colors.INFO}Press Enter to return to menu...{Colors.RESET}")
-                clear_screen()
-                print_banner()
-                continue
-            
-            is_valid, message, frequencies = validate_chirp_csv(csv_file)
-            if not is_valid:
-                print_status(f"CSV validation failed: {message}", "error")
-                input(f"\n{Colors.INFO}Press Enter to return to menu...{Colors.RESET}")
-                clear_screen()
-                print_banner()
-                continue
-            
-            print_status(f"Loaded {len(frequencies)} frequencies.", "success")
-            
-            base_name = os.path.splitext(csv_file)[0]
-            output_file = f"{base_name}.txt"
-            
-            output_choice = get_user_input(f"Output filename (default: {output_file}): ", Colors.INFO)
-            if output_choice:
-                output_file = output_choice
-            
-            converter.to_txt(frequencies, output_file, append=False)
-            print_status(f"Converted to TXT format: {output_file}", "success")
-            
+        is_valid, message, rows = validate_chirp_csv(csv_file, lazy=True)
+        if not is_valid:
+            print_status(f"CSV validation failed: {message}", "error")
             input(f"\n{Colors.INFO}Press Enter to return to menu...{Colors.RESET}")
-            clear_screen()
-            print_banner()
+            return
         
-        elif choice in ['12', 'backups', 'viewbackups']:
-            clear_screen()
-            print_banner()
-            print(f"\n{Colors.HEADER}{'='*60}{Colors.RESET}")
-            print(f"{Colors.HEADER}  BACKUP FILES{Colors.RESET}")
-            print(f"{Colors.HEADER}{'='*60}{Colors.RESET}\n")
-            
-            backup_dir = "backups"
-            if not os.path.exists(backup_dir):
-                print_status("No backups directory found.", "info")
-                print(f"{Colors.INFO}Backups will be saved to: {backup_dir}{Colors.RESET}")
-                input(f"\n{Colors.INFO}Press Enter to return to menu...{Colors.RESET}")
-                clear_screen()
-                print_banner()
-            else:
-                backup_files = [f for f in os.listdir(backup_dir) if f.endswith('.backup')]
-                if backup_files:
-                    backup_files.sort(reverse=True)
-                    print(f"{Colors.SUCCESS}Found {len(backup_files)} backup file(s):{Colors.RESET}\n")
-                    
-                    backup_list = []
-                    for idx, backup_file in enumerate(backup_files[:20], 1):
-                        backup_path = os.path.join(backup_dir, backup_file)
-                        try:
-                            with open(backup_path, 'r') as f:
-                                backup_data = json.load(f)
-                                radio_model = backup_data.get('radio_model', 'Unknown')
-                                serial_port = backup_data.get('serial_port', 'Unknown')
-                                backup_date = backup_data.get('backup_date', 'Unknown')
-                                frequency_count = backup_data.get('frequency_count', 0)
-                                has_data = bool(backup_data.get('frequencies') or backup_data.get('csv_content'))
-                                
-                                backup_list.append(backup_path)
-                                
-                                restore_indicator = f"{Colors.SUCCESS}[RESTORE]{Colors.RESET}" if has_data else f"{Colors.DIM}[NO DATA]{Colors.RESET}"
-                                print(f"  {Colors.INFO}[{idx}]{Colors.RESET} {Colors.HEADER}{backup_file}{Colors.RESET} {restore_indicator}")
-                                print(f"      Radio: {radio_model}")
-                                print(f"      Port: {serial_port}")
-                                print(f"      Date: {backup_date}")
-                                if frequency_count:
-                                    print(f"      Frequencies: {frequency_count}")
-                                print()
-                        except Exception as e:
-                            print(f"  {Colors.INFO}[{idx}]{Colors.RESET} {backup_file} {Colors.DIM}(Error reading metadata){Colors.RESET}\n")
-                            backup_list.append(backup_path)
-                    
-                    if len(backup_files) > 20:
-                        print(f"{Colors.DIM}... and {len(backup_files) - 20} more backup files{Colors.RESET}\n")
-                    
-                    restore_choice = get_user_input(f"\nSelect backup to restore (1-{min(len(backup_files), 20)}) or press Enter to return: ", Colors.INFO)
-                    
-                    if restore_choice:
-                        try:
-                            restore_idx = int(restore_choice) - 1
-                            if 0 <= restore_idx < len(backup_list):
-                                selected_backup = backup_list[restore_idx]
-                                restore_from_backup(selected_backup)
-                            else:
-                                print_status("Invalid selection.", "error")
-                                time.sleep(1)
-                        except ValueError:
-                            print_status("Invalid selection.", "error")
-                            time.sleep(1)
-                else:
-                    print_status("No backup files found.", "info")
-                    input(f"\n{Colors.INFO}Press Enter to return to menu...{Colors.RESET}")
-            
-            clear_screen()
-            print_banner()
+        filter_mode = get_user_input("Filter by mode? (FM/Digital/DMR/P25, or press Enter for all): ", Colors.INFO)
         
-        elif choice in ['14', 'gmrs', 'frs']:
-            clear_screen()
-            print_banner()
-            print(f"\n{Colors.HEADER}{'='*60}{Colors.RESET}")
-            print(f"{Colors.HEADER}  ADD GMRS/FRS CHANNELS{Colors.RESET}")
-            print(f"{Colors.HEADER}{'='*60}{Colors.RESET}\n")
-            
-            print(f"{Colors.INFO}This will add all 22 standard GMRS/FRS channels to your CSV file.{Colors.RESET}")
-            print(f"{Colors.DIM}Channels 1-7, 15-22: Shared FRS/GMRS (2W FRS / 5-50W GMRS){Colors.RESET}")
-            print(f"{Colors.DIM}Channels 8-14: FRS only (0.5W){Colors.RESET}\n")
-            
-            output_file = get_user_input("Output filename (default: gmrs_frs_channels.csv): ", Colors.INFO)
+        try:
+            frequencies = list(rows)
+        except (OSError, UnicodeDecodeError, csv.Error, ValueError) as e:
+            print_status(f"CSV validation failed: {e}", "error")
+            input(f"\n{Colors.INFO}Press Enter to return to menu...{Colors.RESET}")
+            return
+        
+        print_status(f"Loaded {len(frequencies)} frequencies from CSV.", "success")
+        
+        if filter_mode:
+            original_count = len(frequencies)
+            frequencies = converter.filter_frequencies(frequencies, filter_mode)
+            print_status(f"Filtered to {len(frequencies)} frequencies (from {original_count}) using mode: {filter_mode}", "info")
+        
+        if frequencies:
+            output_file = get_user_input("Output filename (default: filtered_frequencies.csv): ", Colors.INFO)
             if not output_file:
-                output_file = "gmrs_frs_channels.csv"
+                output_file = "filtered_frequencies.csv"
             
             format_choice = get_user_input("Format? (csv/txt, or press Enter for auto-detect): ", Colors.INFO)
             if not format_choice:
@@ -4798,83 +5402,273 @@ def run_interactive_mode():
                 else:
                     format_choice = 'csv'
             
-            append_choice = get_user_input("Append to existing file? (y/n, default: n): ", Colors.INFO)
-            append_mode = append_choice.lower() in ['y', 'yes']
-            
-            frequencies = converter.generate_gmrs_frs_channels()
-            
-            if frequencies:
-                if format_choice.lower() == 'txt':
-                    converter.to_txt(frequencies, output_file, append=append_mode)
-                else:
-                    converter.to_chirp_csv(frequencies, output_file, append=append_mode)
-                print_status(f"Added {len(frequencies)} GMRS/FRS channels to {output_file}", "success")
-                print(f"\n{Colors.INFO}Note: GMRS requires an FCC license. FRS channels 1-7 and 15-22 can be used without a license.{Colors.RESET}\n")
+            if format_choice.lower() == 'txt':
+                converter.to_txt(frequencies, output_file, append=False)
             else:
-                print_status("Error generating GMRS/FRS channels.", "error")
+                converter.to_chirp_csv(frequencies, output_file, append=False)
             
-            input(f"\n{Colors.INFO}Press Enter to continue...{Colors.RESET}")
-            clear_screen()
-            print_banner()
+            print_status(f"Filtered frequencies saved to {output_file}", "success")
+        else:
+            print_status("No frequencies remaining after filter.", "warning")
         
-        elif choice in ['15', 'weather', 'wx', 'noaa']:
-            clear_screen()
-            print_banner()
-            print(f"\n{Colors.HEADER}{'='*60}{Colors.RESET}")
-            print(f"{Colors.HEADER}  ADD NOAA WEATHER CHANNELS{Colors.RESET}")
-            print(f"{Colors.HEADER}{'='*60}{Colors.RESET}\n")
-            
-            print(f"{Colors.INFO}This will add all 7 NOAA Weather Radio frequencies.{Colors.RESET}")
-            print(f"{Colors.DIM}Not all frequencies may be active in your area - test to find which ones work.{Colors.RESET}\n")
-            
-            location_choice = get_user_input("Add location info? Enter ZIP code (or press Enter to skip): ", Colors.INFO)
-            location_info = None
-            
-            if location_choice:
-                print_status(f"Looking up location for ZIP: {location_choice}", "info")
-                location_info = converter._get_location_from_zip(location_choice)
-                if location_info:
-                    print_status(f"Found: {location_info.get('city', 'N/A')}, {location_info.get('county', 'N/A')}, {location_info.get('state', 'N/A')}", "success")
-                else:
-                    print_status("Could not determine location. Adding channels without location info.", "warning")
-            
-            output_file = get_user_input("Output filename (default: weather_channels.csv): ", Colors.INFO)
-            if not output_file:
-                output_file = "weather_channels.csv"
-            
-            format_choice = get_user_input("Format? (csv/txt, or press Enter for auto-detect): ", Colors.INFO)
-            if not format_choice:
-                if output_file.lower().endswith('.txt'):
-                    format_choice = 'txt'
-                else:
-                    format_choice = 'csv'
-            
-            append_choice = get_user_input("Append to existing file? (y/n, default: n): ", Colors.INFO)
-            append_mode = append_choice.lower() in ['y', 'yes']
-            
-            frequencies = converter.generate_noaa_weather_channels(location_info)
-            
-            if frequencies:
-                if format_choice.lower() == 'txt':
-                    converter.to_txt(frequencies, output_file, append=append_mode)
-                else:
-                    converter.to_chirp_csv(frequencies, output_file, append=append_mode)
-                print_status(f"Added {len(frequencies)} NOAA Weather channels to {output_file}", "success")
-                print(f"\n{Colors.INFO}Note: Test all 7 frequencies (162.400-162.550 MHz) to find which transmitter is active in your area.{Colors.RESET}\n")
+        input(f"\n{Colors.INFO}Press Enter to return to menu...{Colors.RESET}")
+    
+    def handle_convert_csv():
+        clear_screen()
+        print_banner()
+        print(f"\n{Colors.HEADER}{'='*60}{Colors.RESET}")
+        print(f"{Colors.HEADER}  CONVERT CSV TO TXT{Colors.RESET}")
+        print(f"{Colors.HEADER}{'='*60}{Colors.RESET}\n")
+        
+        csv_file = get_user_input("Enter path to CSV file: ", Colors.INFO)
+        if not csv_file:
+            print_status("No file specified.", "error")
+            input(f"\n{Colors.INFO}Press Enter to return to menu...{Colors.RESET}")
+            return
+        
+        is_valid, message, rows = validate_chirp_csv(csv_file, lazy=True)
+        if not is_valid:
+            print_status(f"CSV validation failed: {message}", "error")
+            input(f"\n{Colors.INFO}Press Enter to return to menu...{Colors.RESET}")
+            return
+        
+        base_name = os.path.splitext(csv_file)[0]
+        output_file = f"{base_name}.txt"
+        
+        output_choice = get_user_input(f"Output filename (default: {output_file}): ", Colors.INFO)
+        if output_choice:
+            output_file = output_choice
+        
+        try:
+            frequencies = list(rows)
+        except (OSError, UnicodeDecodeError, csv.Error, ValueError) as e:
+            print_status(f"CSV validation failed: {e}", "error")
+            input(f"\n{Colors.INFO}Press Enter to return to menu...{Colors.RESET}")
+            return
+        
+        print_status(f"Loaded {len(frequencies)} frequencies.", "success")
+        
+        converter.to_txt(frequencies, output_file, append=False)
+        print_status(f"Converted to TXT format: {output_file}", "success")
+        
+        input(f"\n{Colors.INFO}Press Enter to return to menu...{Colors.RESET}")
+    
+    def handle_view_backups():
+        clear_screen()
+        print_banner()
+        print(f"\n{Colors.HEADER}{'='*60}{Colors.RESET}")
+        print(f"{Colors.HEADER}  BACKUP FILES{Colors.RESET}")
+        print(f"{Colors.HEADER}{'='*60}{Colors.RESET}\n")
+        
+        backup_dir = "backups"
+        if not os.path.exists(backup_dir):
+            print_status("No backups directory found.", "info")
+            print(f"{Colors.INFO}Backups will be saved to: {backup_dir}{Colors.RESET}")
+            input(f"\n{Colors.INFO}Press Enter to return to menu...{Colors.RESET}")
+        else:
+            with os.scandir(backup_dir) as dir_entries:
+                backup_files = [e for e in dir_entries if e.name.endswith('.backup')]
+            if backup_files:
+                backup_files.sort(key=lambda e: e.stat().st_mtime, reverse=True)
+                print(f"{Colors.SUCCESS}Found {len(backup_files)} backup file(s):{Colors.RESET}\n")
+                
+                backup_list = [e.path for e in backup_files[:20]]
+                with ThreadPoolExecutor(max_workers=8) as executor:
+                    backup_metas = list(executor.map(_read_backup_meta, backup_list))
+                
+                listing = []
+                for idx, (backup_entry, meta) in enumerate(zip(backup_files, backup_metas), 1):
+                    backup_file = backup_entry.name
+                    if meta is None:
+                        listing.append(_BACKUP_ERROR_TMPL % (idx, backup_file))
+                        continue
+                    
+                    restore_indicator = _BACKUP_RESTORE_TAG if meta['has_data'] else _BACKUP_NO_DATA_TAG
+                    listing.append(_BACKUP_ROW_TMPL % (idx, backup_file, restore_indicator,
+                                                       meta['radio_model'], meta['serial_port'], meta['backup_date']))
+                    if meta['frequency_count']:
+                        listing.append(f"      Frequencies: {meta['frequency_count']}")
+                    listing.append("")
+                if listing:
+                    print("\n".join(listing))
+                
+                if len(backup_files) > 20:
+                    print(f"{Colors.DIM}... and {len(backup_files) - 20} more backup files{Colors.RESET}\n")
+                
+                restore_choice = get_user_input(f"\nSelect backup to restore (1-{min(len(backup_files), 20)}) or press Enter to return: ", Colors.INFO)
+                
+                if restore_choice:
+                    try:
+                        restore_idx = int(restore_choice) - 1
+                        if 0 <= restore_idx < len(backup_list):
+                            selected_backup = backup_list[restore_idx]
+                            restore_from_backup(selected_backup)
+                        else:
+                            print_status("Invalid selection.", "error")
+                            time.sleep(1)
+                    except ValueError:
+                        print_status("Invalid selection.", "error")
+                        time.sleep(1)
             else:
-                print_status("Error generating weather channels.", "error")
-            
-            input(f"\n{Colors.INFO}Press Enter to continue...{Colors.RESET}")
-            clear_screen()
-            print_banner()
-            
+                print_status("No backup files found.", "info")
+                input(f"\n{Colors.INFO}Press Enter to return to menu...{Colors.RESET}")
+    
+    def handle_gmrs_frs():
+        clear_screen()
+        print_banner()
+        print(f"\n{Colors.HEADER}{'='*60}{Colors.RESET}")
+        print(f"{Colors.HEADER}  ADD GMRS/FRS CHANNELS{Colors.RESET}")
+        print(f"{Colors.HEADER}{'='*60}{Colors.RESET}\n")
+        
+        print(f"{Colors.INFO}This will add all 22 standard GMRS/FRS channels to your CSV file.{Colors.RESET}")
+        print(f"{Colors.DIM}Channels 1-7, 15-22: Shared FRS/GMRS (2W FRS / 5-50W GMRS){Colors.RESET}")
+        print(f"{Colors.DIM}Channels 8-14: FRS only (0.5W){Colors.RESET}\n")
+        
+        output_file = get_user_input("Output filename (default: gmrs_frs_channels.csv): ", Colors.INFO)
+        if not output_file:
+            output_file = "gmrs_frs_channels.csv"
+        
+        format_choice = get_user_input("Format? (csv/txt, or press Enter for auto-detect): ", Colors.INFO)
+        if not format_choice:
+            if output_file.lower().endswith('.txt'):
+                format_choice = 'txt'
+            else:
+                format_choice = 'csv'
+        
+        append_choice = get_user_input("Append to existing file? (y/n, default: n): ", Colors.INFO)
+        append_mode = append_choice.lower() in ['y', 'yes']
+        
+        frequencies = converter.generate_gmrs_frs_channels()
+        
+        if frequencies:
+            if format_choice.lower() == 'txt':
+                converter.to_txt(frequencies, output_file, append=append_mode)
+            else:
+                converter.to_chirp_csv(frequencies, output_file, append=append_mode)
+            print_status(f"Added {len(frequencies)} GMRS/FRS channels to {output_file}", "success")
+            print(f"\n{Colors.INFO}Note: GMRS requires an FCC license. FRS channels 1-7 and 15-22 can be used without a license.{Colors.RESET}\n")
         else:
+            print_status("Error generating GMRS/FRS channels.", "error")
+        
+        input(f"\n{Colors.INFO}Press Enter to continue...{Colors.RESET}")
+    
+    def handle_noaa_weather():
+        clear_screen()
+        print_banner()
+        print(f"\n{Colors.HEADER}{'='*60}{Colors.RESET}")
+        print(f"{Colors.HEADER}  ADD NOAA WEATHER CHANNELS{Colors.RESET}")
+        print(f"{Colors.HEADER}{'='*60}{Colors.RESET}\n")
+        
+        print(f"{Colors.INFO}This will add all 7 NOAA Weather Radio frequencies.{Colors.RESET}")
+        print(f"{Colors.DIM}Not all frequencies may be active in your area - test to find which ones work.{Colors.RESET}\n")
+        
+        location_choice = get_user_input("Add location info? Enter ZIP code (or press Enter to skip): ", Colors.INFO)
+        location_info = None
+        location_future = None
+        lookup_messages = []
+        
+        if location_choice:
+            # Resolve the ZIP in the background while the remaining prompts are answered
+            print_status(f"Looking up location for ZIP: {location_choice}", "info")
+            lookup_executor = ThreadPoolExecutor(max_workers=1)
+            location_future = lookup_executor.submit(_call_capturing_status, lookup_messages,
+                                                     converter._get_location_from_zip, location_choice)
+            lookup_executor.shutdown(wait=False)
+        
+        output_file = get_user_input("Output filename (default: weather_channels.csv): ", Colors.INFO)
+        if not output_file:
+            output_file = "weather_channels.csv"
+        
+        format_choice = get_user_input("Format? (csv/txt, or press Enter for auto-detect): ", Colors.INFO)
+        if not format_choice:
+            if output_file.lower().endswith('.txt'):
+                format_choice = 'txt'
+            else:
+                format_choice = 'csv'
+        
+        append_choice = get_user_input("Append to existing file? (y/n, default: n): ", Colors.INFO)
+        append_mode = append_choice.lower() in ['y', 'yes']
+        
+        if location_future is not None:
+            timed_out = False
+            try:
+                location_info = location_future.result(timeout=converter.ZIP_LOOKUP_TIMEOUT)
+            except FuturesTimeoutError:
+                timed_out = True
+            except Exception:
+                location_info = None
+            if lookup_messages:
+                print("\n".join(list(lookup_messages)))
+            if location_info:
+                print_status(f"Found: {location_info.get('city', 'N/A')}, {location_info.get('county', 'N/A')}, {location_info.get('state', 'N/A')}", "success")
+            elif timed_out:
+                print_status(f"ZIP lookup timed out after {converter.ZIP_LOOKUP_TIMEOUT}s. Adding channels without location info.", "warning")
+            else:
+                print_status("Could not determine location. Adding channels without location info.", "warning")
+        
+        frequencies = converter.generate_noaa_weather_channels(location_info)
+        
+        if frequencies:
+            if format_choice.lower() == 'txt':
+                converter.to_txt(frequencies, output_file, append=append_mode)
+            else:
+                converter.to_chirp_csv(frequencies, output_file, append=append_mode)
+            print_status(f"Added {len(frequencies)} NOAA Weather channels to {output_file}", "success")
+            print(f"\n{Colors.INFO}Note: Test all 7 frequencies (162.400-162.550 MHz) to find which transmitter is active in your area.{Colors.RESET}\n")
+        else:
+            print_status("Error generating weather channels.", "error")
+        
+        input(f"\n{Colors.INFO}Press Enter to continue...{Colors.RESET}")
+    
+    def handle_clear_cache():
+        nonlocal redraw
+        clear_screen()
+        print_banner()
+        removed = converter.clear_page_cache() if converter is not None else 0
+        print_status(f"Cleared {removed} cached lookup(s). Next searches will fetch fresh data.", "success")
+        redraw = False
+    
+    def handle_invalid_choice():
+        clear_screen()
+        print_banner()
+        print_status("Invalid option. Please select 1-15, C, or 0/Q to exit.", "error")
+        time.sleep(2)
+    
+    menu_handlers = {}
+    for aliases, handler in (
+        (('0', 'q', 'quit', 'exit'), handle_exit),
+        (('1', 'zip', 'zipcode'), handle_zip_search),
+        (('2', 'city'), handle_city_search),
+        (('3', 'county'), handle_county_search),
+        (('4', 'import', 'upload'), handle_import),
+        (('5', 'backup', 'save'), handle_backup),
+        (('6', 'restore'), handle_restore),
+        (('7', 'validate'), handle_validate),
+        (('8', 'ports', 'serial'), handle_serial_ports),
+        (('9', 'models', 'radios', 'select'), handle_select_radio_model),
+        (('10', 'filter'), handle_filter_csv),
+        (('11', 'convert', 'csv2txt'), handle_convert_csv),
+        (('12', 'backups', 'viewbackups'), handle_view_backups),
+        (('13', 'cache', 'buildcache'), handle_build_county_cache),
+        (('14', 'gmrs', 'frs'), handle_gmrs_frs),
+        (('15', 'weather', 'wx', 'noaa'), handle_noaa_weather),
+        (('c', 'clear', 'clearcache'), handle_clear_cache),
+    ):
+        for alias in aliases:
+            menu_handlers[alias] = handler
+    
+    while True:
+        if redraw:
             clear_screen()
             print_banner()
-            print_status("Invalid option. Please select 1-15, or 0/Q to exit.", "error")
-            time.sleep(2)
-            clear_screen()
-            print_banner()
+        redraw = True
+        print_menu()
+        choice = get_user_input("Select an option: ", Colors.HEADER).strip().lower()
+        
+        if converter is None and choice in _CONVERTER_CHOICES:
+            converter = RadioRefToChirp()
+        
+        menu_handlers.get(choice, handle_invalid_choice)()
 
 
 ensure_chirp_installed()
@@ -4926,6 +5720,8 @@ Note: Use responsibly and comply with Radio Reference Terms of Service.
                        help='Append to existing file instead of overwriting')
     parser.add_argument('--weather-zip', type=str,
                        help='ZIP code for location-specific weather channel info (use with --weather)')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Always fetch fresh pages and ZIP lookups instead of reusing ones cached this session')
     
     args = parser.parse_args()
     